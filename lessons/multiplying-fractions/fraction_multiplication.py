@@ -1,5 +1,12 @@
+import sys
+from pathlib import Path
+
 from manim import *
 
+# Shared build helpers live at the repository root (render/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from render.i18n import gettext as _
+
 
 class HalfOfAThird(Scene):
     """
@@ -50,7 +57,7 @@ class HalfOfAThird(Scene):
         self.wait(0.5)
 
         # Label: "Three thirds"
-        thirds_label = Text("Three equal parts", font_size=28, color=GRAY).to_edge(UP)
+        thirds_label = Text(_("Three equal parts"), font_size=28, color=GRAY).to_edge(UP)
         self.play(Write(thirds_label))
         self.wait(1)
         self.play(FadeOut(thirds_label))
@@ -72,7 +79,7 @@ class HalfOfAThird(Scene):
 
         self.play(FadeIn(top_third), run_time=0.8)
 
-        third_label = Text("This is 1/3", font_size=32, color=THIRD_COLOR).to_edge(UP)
+        third_label = Text(_("This is 1/3"), font_size=32, color=THIRD_COLOR).to_edge(UP)
         self.play(Write(third_label))
         self.wait(1.5)
         self.play(FadeOut(third_label))
@@ -81,7 +88,7 @@ class HalfOfAThird(Scene):
         # STEP 4: Cut in half (vertical line)
         # ═══════════════════════════════════════════════════════
 
-        half_label = Text("Now take half of it", font_size=28, color=GRAY).to_edge(UP)
+        half_label = Text(_("Now take half of it"), font_size=28, color=GRAY).to_edge(UP)
         self.play(Write(half_label))
         self.wait(0.5)
 
@@ -110,7 +117,7 @@ class HalfOfAThird(Scene):
         # Fade out the full third, show the half
         self.play(FadeOut(top_third), FadeIn(half_of_third), run_time=0.8)
 
-        result_label = Text("Half of one-third", font_size=32, color=PRODUCT_COLOR).to_edge(UP)
+        result_label = Text(_("Half of one-third"), font_size=32, color=PRODUCT_COLOR).to_edge(UP)
         self.play(Write(result_label))
         self.wait(1.5)
         self.play(FadeOut(result_label))
@@ -121,7 +128,7 @@ class HalfOfAThird(Scene):
 
         # "How much of the square is this?" with "this" in purple
         question = MarkupText(
-            f'How much of the square is <span foreground="{PRODUCT_COLOR}">this</span>?',
+            _('How much of the square is <span foreground="{color}">this</span>?').format(color=PRODUCT_COLOR),
             font_size=28,
             color=GRAY
         )
@@ -199,7 +206,7 @@ class AreaOfRectangle(Scene):
         self.play(Write(side_bottom), Write(side_left))
         self.wait(0.5)
 
-        area_label = Text("Area = 1", font_size=32, color=GRAY).to_edge(UP)
+        area_label = Text(_("Area = 1"), font_size=32, color=GRAY).to_edge(UP)
         self.play(Write(area_label))
         self.wait(1)
         self.play(FadeOut(area_label), FadeOut(side_bottom), FadeOut(side_left))
@@ -240,7 +247,7 @@ class AreaOfRectangle(Scene):
 
         # "What's the area of this rectangle?" with "rectangle" in blue
         question = MarkupText(
-            f'What\'s the area of this <span foreground="{RECT_COLOR}">rectangle</span>?',
+            _('What\'s the area of this <span foreground="{color}">rectangle</span>?').format(color=RECT_COLOR),
             font_size=28,
             color=GRAY
         )
@@ -278,7 +285,7 @@ class AreaOfRectangle(Scene):
         # ═══════════════════════════════════════════════════════
 
         # Show "Area = 1/6" below the question (keep labels visible)
-        answer = Text("Area = 1/6", font_size=36, color=RECT_COLOR)
+        answer = Text(_("Area = 1/6"), font_size=36, color=RECT_COLOR)
         answer.next_to(question, DOWN, buff=0.4)
         self.play(FadeIn(answer))
         self.wait(1.5)
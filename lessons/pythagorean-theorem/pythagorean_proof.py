@@ -1,5 +1,13 @@
+import sys
+from pathlib import Path
+
 from manim import *
 
+# Shared build helpers live at the repository root (render/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from render.i18n import gettext as _
+from render.mobjects import PolygonBatch
+
 
 def make_equation(parts, font_size=48):
     """Create equation from parts without LaTeX.
@@ -33,7 +41,8 @@ class PythagoreanProof(Scene):
         # PART 1: INTRODUCTION
         # ═══════════════════════════════════════════════════════
 
-        title = Text("The Pythagorean Theorem", font_size=52)
+        self.next_section(_("Introduction"))
+        title = Text(_("The Pythagorean Theorem"), font_size=52)
         self.play(Write(title), run_time=1.5)
         self.wait(2)
         self.play(FadeOut(title))
@@ -52,14 +61,14 @@ class PythagoreanProof(Scene):
         tri_verts = intro_tri.get_vertices()
 
         label_a = Text("a", font_size=48, color=A_COLOR).next_to(intro_tri, DOWN, buff=0.2)
-        explain_a = Text("(one leg)", font_size=24, color=GRAY).next_to(label_a, DOWN, buff=0.1)
+        explain_a = Text(_("(one leg)"), font_size=24, color=GRAY).next_to(label_a, DOWN, buff=0.1)
 
         self.play(Write(label_a))
         self.play(FadeIn(explain_a))
         self.wait(1)
 
         label_b = Text("b", font_size=48, color=B_COLOR).next_to(intro_tri, RIGHT, buff=0.2)
-        explain_b = Text("(other leg)", font_size=24, color=GRAY).next_to(label_b, RIGHT, buff=0.1)
+        explain_b = Text(_("(other leg)"), font_size=24, color=GRAY).next_to(label_b, RIGHT, buff=0.1)
 
         self.play(Write(label_b))
         self.play(FadeIn(explain_b))
@@ -78,7 +87,7 @@ class PythagoreanProof(Scene):
 
         hyp_center = (tri_verts[0] + tri_verts[2]) / 2
         label_c = Text("c", font_size=48, color=C_COLOR).move_to(hyp_center + UL * 0.4)
-        explain_c = Text("(hypotenuse)", font_size=24, color=GRAY)
+        explain_c = Text(_("(hypotenuse)"), font_size=24, color=GRAY)
         explain_c.next_to(label_c, UP, buff=0.15)
 
         self.play(Write(label_c))
@@ -90,7 +99,7 @@ class PythagoreanProof(Scene):
         self.wait(0.5)
 
         # Show the theorem
-        theorem_intro = Text("The theorem says:", font_size=32).to_edge(UP)
+        theorem_intro = Text(_("The theorem says:"), font_size=32).to_edge(UP)
         self.play(Write(theorem_intro))
         self.wait(0.5)
 
@@ -115,11 +124,12 @@ class PythagoreanProof(Scene):
         # PART 2: WHY IS IT TRUE?
         # ═══════════════════════════════════════════════════════
 
-        why_title = Text("But WHY is this true?", font_size=48)
+        self.next_section(_("Why is it true"))
+        why_title = Text(_("But WHY is this true?"), font_size=48)
         self.play(Write(why_title), run_time=1.2)
         self.wait(1.5)
 
-        lets_see = Text("Let's see a visual proof!", font_size=36, color=YELLOW)
+        lets_see = Text(_("Let's see a visual proof!"), font_size=36, color=YELLOW)
         lets_see.next_to(why_title, DOWN, buff=0.6)
         self.play(Write(lets_see))
         self.wait(2)
@@ -131,8 +141,9 @@ class PythagoreanProof(Scene):
         # PART 3: THE VISUAL PROOF
         # ═══════════════════════════════════════════════════════
 
+        self.next_section(_("The visual proof"))
         # First, show the triangle we'll be working with
-        setup_text = Text("Here's our right triangle", font_size=30).to_edge(UP)
+        setup_text = Text(_("Here's our right triangle"), font_size=30).to_edge(UP)
         self.play(Write(setup_text))
         self.wait(0.5)
 
@@ -159,11 +170,11 @@ class PythagoreanProof(Scene):
         self.play(FadeOut(setup_text))
 
         # Explain the plan
-        plan_text = Text("We'll use 4 of these triangles", font_size=28).to_edge(UP)
+        plan_text = Text(_("We'll use 4 of these triangles"), font_size=28).to_edge(UP)
         self.play(Write(plan_text))
         self.wait(1.5)
 
-        plan_text2 = Text("to partially fill a square with side (a + b)", font_size=28).to_edge(UP)
+        plan_text2 = Text(_("to partially fill a square with side (a + b)"), font_size=28).to_edge(UP)
         self.play(ReplacementTransform(plan_text, plan_text2))
         self.wait(1.5)
 
@@ -181,7 +192,7 @@ class PythagoreanProof(Scene):
         tr = big_square.get_corner(UR)
         tl = big_square.get_corner(UL)
 
-        step1 = Text("Step 1: A square with side (a + b)", font_size=28).to_edge(UP)
+        step1 = Text(_("Step 1: A square with side (a + b)"), font_size=28).to_edge(UP)
         self.play(Write(step1))
         self.wait(0.5)
         self.play(Create(big_square), run_time=1.5)
@@ -198,7 +209,7 @@ class PythagoreanProof(Scene):
         # Configuration 1: Four triangles with c² in center
         # ─────────────────────────────────────────────────────
 
-        step2 = Text("Step 2: Place 4 a-b-c right triangles", font_size=28).to_edge(UP)
+        step2 = Text(_("Step 2: Place 4 a-b-c right triangles"), font_size=28).to_edge(UP)
         self.play(Write(step2))
         self.wait(1)
 
@@ -252,7 +263,7 @@ class PythagoreanProof(Scene):
         self.wait(0.5)
 
         # Highlight the center square
-        step3 = Text("A square forms in the center", font_size=28).to_edge(UP)
+        step3 = Text(_("A square forms in the center"), font_size=28).to_edge(UP)
         self.play(Write(step3))
         self.wait(0.5)
 
@@ -265,7 +276,7 @@ class PythagoreanProof(Scene):
         self.play(FadeOut(step3))
 
         # Label center square as c² - each side is c (the hypotenuse)
-        step3b = Text("It has area c²", font_size=28).to_edge(UP)
+        step3b = Text(_("It has area c²"), font_size=28).to_edge(UP)
         self.play(Write(step3b))
         self.wait(0.5)
 
@@ -276,7 +287,7 @@ class PythagoreanProof(Scene):
         self.play(FadeOut(step3b))
 
         # Configuration 1 label
-        config1_text = Text("Configuration 1", font_size=26).to_edge(UP)
+        config1_text = Text(_("Configuration 1"), font_size=26).to_edge(UP)
         self.play(Write(config1_text))
         self.wait(2)
 
@@ -288,7 +299,7 @@ class PythagoreanProof(Scene):
         # Configuration 2: Rearrange to show a² and b²
         # ─────────────────────────────────────────────────────
 
-        step4 = Text("Step 3: Rearrange the triangles", font_size=28).to_edge(UP)
+        step4 = Text(_("Step 3: Rearrange the triangles"), font_size=28).to_edge(UP)
         self.play(Write(step4))
         self.wait(1.5)
 
@@ -339,7 +350,7 @@ class PythagoreanProof(Scene):
         self.wait(0.5)
 
         # Highlight the two squares with labels on their sides
-        step5 = Text("Two squares appear!", font_size=28).to_edge(UP)
+        step5 = Text(_("Two squares appear!"), font_size=28).to_edge(UP)
         self.play(Write(step5), FadeOut(new_labels))
         self.wait(1)
 
@@ -374,7 +385,7 @@ class PythagoreanProof(Scene):
         self.play(FadeOut(step5))
 
         # Configuration 2 label
-        config2_text = Text("Configuration 2", font_size=26).to_edge(UP)
+        config2_text = Text(_("Configuration 2"), font_size=26).to_edge(UP)
         self.play(Write(config2_text))
         self.wait(2)
 
@@ -385,6 +396,7 @@ class PythagoreanProof(Scene):
         # PART 4: SHOW BOTH SIDE BY SIDE
         # ═══════════════════════════════════════════════════════
 
+        self.next_section(_("Side by side"))
         # Fade current view
         self.play(
             FadeOut(big_square), FadeOut(t1), FadeOut(t2), FadeOut(t3), FadeOut(t4),
@@ -395,7 +407,7 @@ class PythagoreanProof(Scene):
         )
         self.wait(0.5)
 
-        comparison_title = Text("Both use the same big square", font_size=28).to_edge(UP)
+        comparison_title = Text(_("Both use the same big square"), font_size=28).to_edge(UP)
         self.play(Write(comparison_title))
         self.wait(1)
 
@@ -411,10 +423,13 @@ class PythagoreanProof(Scene):
         tr1 = sq1.get_corner(UR)
         tl1 = sq1.get_corner(UL)
 
-        t1_c1 = Polygon(bl1, bl1 + RIGHT * a * s, bl1 + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t2_c1 = Polygon(br1, br1 + UP * a * s, br1 + LEFT * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t3_c1 = Polygon(tr1, tr1 + LEFT * a * s, tr1 + DOWN * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t4_c1 = Polygon(tl1, tl1 + DOWN * a * s, tl1 + RIGHT * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
+        # All 4 triangles as one batch (one path, one fill)
+        tris_c1 = PolygonBatch([
+            [bl1, bl1 + RIGHT * a * s, bl1 + UP * b * s],
+            [br1, br1 + UP * a * s, br1 + LEFT * b * s],
+            [tr1, tr1 + LEFT * a * s, tr1 + DOWN * b * s],
+            [tl1, tl1 + DOWN * a * s, tl1 + RIGHT * b * s],
+        ], color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
 
         center_c1 = Polygon(
             bl1 + RIGHT * a * s, br1 + UP * a * s, tr1 + LEFT * a * s, tl1 + DOWN * a * s,
@@ -422,7 +437,7 @@ class PythagoreanProof(Scene):
         )
         c_label_c1 = Text("c²", font_size=36, color=C_COLOR).move_to(center_c1)
 
-        config1_group = VGroup(sq1, t1_c1, t2_c1, t3_c1, t4_c1, center_c1, c_label_c1)
+        config1_group = VGroup(sq1, tris_c1, center_c1, c_label_c1)
 
         # Config 2 (right)
         sq2 = Square(side_length=side * s, color=WHITE, stroke_width=2)
@@ -433,10 +448,12 @@ class PythagoreanProof(Scene):
         tr2 = sq2.get_corner(UR)
         tl2 = sq2.get_corner(UL)
 
-        t1_c2 = Polygon(bl2, bl2 + RIGHT * a * s, bl2 + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t2_c2 = Polygon(bl2 + UP * b * s, bl2 + RIGHT * a * s, bl2 + RIGHT * a * s + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t3_c2 = Polygon(tr2, tr2 + LEFT * b * s, tr2 + DOWN * a * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t4_c2 = Polygon(tr2 + DOWN * a * s, tr2 + LEFT * b * s, tr2 + LEFT * b * s + DOWN * a * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
+        tris_c2 = PolygonBatch([
+            [bl2, bl2 + RIGHT * a * s, bl2 + UP * b * s],
+            [bl2 + UP * b * s, bl2 + RIGHT * a * s, bl2 + RIGHT * a * s + UP * b * s],
+            [tr2, tr2 + LEFT * b * s, tr2 + DOWN * a * s],
+            [tr2 + DOWN * a * s, tr2 + LEFT * b * s, tr2 + LEFT * b * s + DOWN * a * s],
+        ], color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
 
         a_sq_c2 = Square(side_length=a * s, color=A_COLOR, fill_color=RED_E, fill_opacity=0.5)
         a_sq_c2.move_to(tl2 + RIGHT * a * s / 2 + DOWN * a * s / 2)
@@ -446,7 +463,7 @@ class PythagoreanProof(Scene):
         b_sq_c2.move_to(br2 + LEFT * b * s / 2 + UP * b * s / 2)
         b_label_c2 = Text("b²", font_size=28, color=B_COLOR).move_to(b_sq_c2)
 
-        config2_group = VGroup(sq2, t1_c2, t2_c2, t3_c2, t4_c2, a_sq_c2, b_sq_c2, a_label_c2, b_label_c2)
+        config2_group = VGroup(sq2, tris_c2, a_sq_c2, b_sq_c2, a_label_c2, b_label_c2)
 
         self.play(FadeIn(config1_group), FadeIn(config2_group), run_time=1.5)
         self.wait(1)
@@ -454,17 +471,17 @@ class PythagoreanProof(Scene):
         self.play(FadeOut(comparison_title))
 
         # Show labels under each configuration
-        label1 = Text("Configuration 1", font_size=20).next_to(sq1, DOWN, buff=0.25)
-        label2 = Text("Configuration 2", font_size=20).next_to(sq2, DOWN, buff=0.25)
+        label1 = Text(_("Configuration 1"), font_size=20).next_to(sq1, DOWN, buff=0.25)
+        label2 = Text(_("Configuration 2"), font_size=20).next_to(sq2, DOWN, buff=0.25)
         self.play(Write(label1), Write(label2))
         self.wait(1)
 
         # Explain the key insight
-        insight_text = Text("The area not covered by triangles", font_size=26).to_edge(UP)
+        insight_text = Text(_("The area not covered by triangles"), font_size=26).to_edge(UP)
         self.play(Write(insight_text))
         self.wait(1)
 
-        insight_text2 = Text("must be the same in both!", font_size=26).to_edge(UP)
+        insight_text2 = Text(_("must be the same in both!"), font_size=26).to_edge(UP)
         self.play(ReplacementTransform(insight_text, insight_text2))
         self.wait(1)
 
@@ -513,6 +530,7 @@ class PythagoreanProof(Scene):
         # PART 5: CONCLUSION
         # ═══════════════════════════════════════════════════════
 
+        self.next_section(_("Conclusion"))
         self.play(
             FadeOut(config1_group), FadeOut(config2_group),
             FadeOut(label1), FadeOut(label2),
@@ -521,7 +539,7 @@ class PythagoreanProof(Scene):
         self.wait(0.5)
 
         # Final reveal
-        therefore = Text("Therefore:", font_size=40).move_to(UP * 1.5)
+        therefore = Text(_("Therefore:"), font_size=40).move_to(UP * 1.5)
         self.play(Write(therefore))
         self.wait(0.5)
 
@@ -537,7 +555,7 @@ class PythagoreanProof(Scene):
         self.play(Create(box))
         self.wait(1)
 
-        tada = Text("The Pythagorean Theorem!", font_size=36, color=GREEN)
+        tada = Text(_("The Pythagorean Theorem!"), font_size=36, color=GREEN)
         tada.next_to(box, DOWN, buff=0.5)
         self.play(Write(tada))
         self.wait(3)
@@ -548,11 +566,11 @@ class PythagoreanProof(Scene):
 
 class NumericExample(Scene):
     def construct(self):
-        title = Text("Let's Check with Numbers", font_size=44).to_edge(UP)
+        title = Text(_("Let's Check with Numbers"), font_size=44).to_edge(UP)
         self.play(Write(title), run_time=1)
         self.wait(1.5)
 
-        subtitle = Text("The 3-4-5 triangle", font_size=32, color=GRAY)
+        subtitle = Text(_("The 3-4-5 triangle"), font_size=32, color=GRAY)
         subtitle.next_to(title, DOWN, buff=0.3)
         self.play(Write(subtitle))
         self.wait(1.5)
@@ -619,7 +637,7 @@ class NumericExample(Scene):
         self.play(Write(line4), Write(check))
         self.wait(1)
 
-        works = Text("It works!", font_size=40, color=YELLOW)
+        works = Text(_("It works!"), font_size=40, color=YELLOW)
         works.move_to(DOWN * 2.5)
         self.play(Write(works))
         self.wait(2.5)
@@ -647,10 +665,12 @@ class ConfigurationDiagrams(Scene):
         tr1 = sq1.get_corner(UR)
         tl1 = sq1.get_corner(UL)
 
-        t1_c1 = Polygon(bl1, bl1 + RIGHT * a * s, bl1 + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t2_c1 = Polygon(br1, br1 + UP * a * s, br1 + LEFT * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t3_c1 = Polygon(tr1, tr1 + LEFT * a * s, tr1 + DOWN * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t4_c1 = Polygon(tl1, tl1 + DOWN * a * s, tl1 + RIGHT * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
+        tris_c1 = PolygonBatch([
+            [bl1, bl1 + RIGHT * a * s, bl1 + UP * b * s],
+            [br1, br1 + UP * a * s, br1 + LEFT * b * s],
+            [tr1, tr1 + LEFT * a * s, tr1 + DOWN * b * s],
+            [tl1, tl1 + DOWN * a * s, tl1 + RIGHT * b * s],
+        ], color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
 
         center_c1 = Polygon(
             bl1 + RIGHT * a * s, br1 + UP * a * s, tr1 + LEFT * a * s, tl1 + DOWN * a * s,
@@ -658,7 +678,7 @@ class ConfigurationDiagrams(Scene):
         )
         c_label = Text("c²", font_size=32, color=YELLOW).move_to(center_c1)
 
-        label1 = Text("Configuration 1", font_size=22).next_to(sq1, DOWN, buff=0.3)
+        label1 = Text(_("Configuration 1"), font_size=22).next_to(sq1, DOWN, buff=0.3)
 
         # Config 2
         sq2 = Square(side_length=side * s, color=WHITE, stroke_width=2)
@@ -669,10 +689,12 @@ class ConfigurationDiagrams(Scene):
         tr2 = sq2.get_corner(UR)
         tl2 = sq2.get_corner(UL)
 
-        t1_c2 = Polygon(bl2, bl2 + RIGHT * a * s, bl2 + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t2_c2 = Polygon(bl2 + UP * b * s, bl2 + RIGHT * a * s, bl2 + RIGHT * a * s + UP * b * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t3_c2 = Polygon(tr2, tr2 + LEFT * b * s, tr2 + DOWN * a * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
-        t4_c2 = Polygon(tr2 + DOWN * a * s, tr2 + LEFT * b * s, tr2 + LEFT * b * s + DOWN * a * s, color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
+        tris_c2 = PolygonBatch([
+            [bl2, bl2 + RIGHT * a * s, bl2 + UP * b * s],
+            [bl2 + UP * b * s, bl2 + RIGHT * a * s, bl2 + RIGHT * a * s + UP * b * s],
+            [tr2, tr2 + LEFT * b * s, tr2 + DOWN * a * s],
+            [tr2 + DOWN * a * s, tr2 + LEFT * b * s, tr2 + LEFT * b * s + DOWN * a * s],
+        ], color=TRI_COLOR, fill_color=TRI_FILL, fill_opacity=0.7)
 
         a_sq = Square(side_length=a * s, color=RED, fill_color=RED_E, fill_opacity=0.5)
         a_sq.move_to(tl2 + RIGHT * a * s / 2 + DOWN * a * s / 2)
@@ -682,16 +704,16 @@ class ConfigurationDiagrams(Scene):
         b_sq.move_to(br2 + LEFT * b * s / 2 + UP * b * s / 2)
         b_label = Text("b²", font_size=28, color=GREEN).move_to(b_sq)
 
-        label2 = Text("Configuration 2", font_size=22).next_to(sq2, DOWN, buff=0.3)
+        label2 = Text(_("Configuration 2"), font_size=22).next_to(sq2, DOWN, buff=0.3)
 
         # Equals
         eq = Text("=", font_size=48).move_to(ORIGIN)
 
         # Title
-        title = Text("Both use 4 identical blue triangles", font_size=26, color=GRAY).to_edge(UP)
+        title = Text(_("Both use 4 identical blue triangles"), font_size=26, color=GRAY).to_edge(UP)
 
         self.add(
-            sq1, t1_c1, t2_c1, t3_c1, t4_c1, center_c1, c_label, label1,
-            sq2, t1_c2, t2_c2, t3_c2, t4_c2, a_sq, b_sq, a_label, b_label, label2,
+            sq1, tris_c1, center_c1, c_label, label1,
+            sq2, tris_c2, a_sq, b_sq, a_label, b_label, label2,
             eq, title
         )
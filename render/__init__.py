@@ -0,0 +1,42 @@
+"""Build tooling for the lesson videos.
+
+The lesson scripts stay plain manim scenes (``manim -qm pythagorean_proof.py
+PythagoreanProof`` still works from a lesson folder). Rendering them through
+``python -m render`` from the repository root swaps in the faster pieces
+below without touching the scenes themselves.
+"""
+
+from .build import lesson_scripts, load_scenes, render_scene
+from .interpolation import BatchedScene, TransformBatch, batched
+from .mobjects import PolygonBatch
+from .pacing import PacedScene, Pacing, paced
+from .profiles import Profile, tune_movie
+from .remote_cache import RemoteCache, use_remote_cache
+from .renderer import LayoutRenderer, LessonRenderer, SnapshotRenderer
+from .ring import FrameRing, RingMetrics
+from .tiles import TiledCamera
+from .writer import LessonFileWriter
+
+__all__ = [
+    "BatchedScene",
+    "FrameRing",
+    "LayoutRenderer",
+    "LessonFileWriter",
+    "LessonRenderer",
+    "PacedScene",
+    "Pacing",
+    "PolygonBatch",
+    "Profile",
+    "RemoteCache",
+    "RingMetrics",
+    "SnapshotRenderer",
+    "TiledCamera",
+    "TransformBatch",
+    "batched",
+    "lesson_scripts",
+    "load_scenes",
+    "paced",
+    "render_scene",
+    "tune_movie",
+    "use_remote_cache",
+]
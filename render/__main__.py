@@ -0,0 +1,47 @@
+"""Command line entry point: ``python -m render <script> [scene ...]``."""
+
+import argparse
+
+from .build import QUALITY_FLAGS, load_scenes, render_variants
+from .pacing import PACINGS, Pacing
+from .remote_cache import use_remote_cache
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render", description=__doc__)
+    parser.add_argument("script", help="lesson script, e.g. lessons/pythagorean-theorem/pythagorean_proof.py")
+    parser.add_argument("scenes", nargs="*", help="scenes to render (default: all)")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="m")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="re-encode with the encoding profile recorded in the lesson's encoding.json",
+    )
+    parser.add_argument(
+        "--retune", action="store_true",
+        help="search for a new encoding profile even if one is recorded (implies --profile)",
+    )
+    parser.add_argument(
+        "--pacing", action="append", default=[], type=Pacing.parse,
+        help=f"also render a pacing variant: {', '.join(PACINGS)} or e.g. wait=1.5,run_time=1.2 (repeatable)",
+    )
+    parser.add_argument(
+        "--locale", action="append", default=[],
+        help="also render with the captions from locales/<LOCALE>.json, or 'all' (repeatable)",
+    )
+    parser.add_argument(
+        "--cache", metavar="URL", default=None,
+        help="shared render cache server (default: $RENDER_CACHE_URL)",
+    )
+    args = parser.parse_args(argv)
+
+    scenes = args.scenes or list(load_scenes(args.script))
+    with use_remote_cache(args.cache):
+        for name in scenes:
+            render_variants(
+                args.script, name, QUALITY_FLAGS[args.quality], args.pacing, args.locale,
+                profile=args.profile or args.retune, retune=args.retune,
+            )
+
+
+if __name__ == "__main__":
+    main()
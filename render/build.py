@@ -0,0 +1,123 @@
+"""Render lesson scenes with the lesson renderer instead of the stock CLI."""
+
+from pathlib import Path
+
+from manim import config, tempconfig
+from manim.utils.module_ops import get_module, get_scene_classes_from_module
+
+from .chapters import reindex_chapters
+from .i18n import available_locales, use_locale
+from .interpolation import batched
+from .pacing import paced
+from .profiles import tune_movie
+from .renderer import LessonRenderer
+
+ROOT = Path(__file__).resolve().parent.parent
+LESSONS_DIR = ROOT / "lessons"
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def lesson_scripts():
+    """All lesson scripts, e.g. ``lessons/pythagorean-theorem/pythagorean_proof.py``."""
+    return sorted(
+        path for path in LESSONS_DIR.glob("*/*.py")
+        if not path.name.startswith("_")
+    )
+
+
+_loaded = {}
+
+
+def load_scenes(script):
+    """Import a lesson script and return its scene classes by name.
+
+    Scripts are only re-imported when they change on disk, so a long-lived
+    process (see :mod:`render.daemon`) keeps the classes it already has.
+    """
+    script = Path(script).resolve()
+    mtime = script.stat().st_mtime_ns
+    cached = _loaded.get(script)
+    if cached is None or cached[0] != mtime:
+        module = get_module(script)
+        cached = _loaded[script] = (
+            mtime, {cls.__name__: cls for cls in get_scene_classes_from_module(module)},
+        )
+    return cached[1]
+
+
+def scene_config(script, quality="medium_quality", **overrides):
+    """Config matching ``manim -q<quality> <script>`` run from the lesson folder."""
+    script = Path(script).resolve()
+    options = {
+        "input_file": script,
+        "media_dir": script.parent / "media",
+        "quality": quality,
+    }
+    options.update(overrides)
+    return options
+
+
+def render_scene(
+    script, scene_name, quality="medium_quality", renderer_class=LessonRenderer,
+    profile=False, retune=False, pacing=None, locale=None, **overrides,
+):
+    """Render one scene of a lesson script into that lesson's ``media`` folder.
+
+    With ``profile`` the finished movie is re-encoded with the scene's
+    recorded encoding profile, searching for one first if there is none
+    yet or ``retune`` is set (see :mod:`render.profiles`).
+
+    A :class:`~.Pacing` renders a slower or faster variant to
+    ``<Scene>_<pacing>.mp4``, reusing the cached plays it leaves unchanged.
+    A ``locale`` translates the captions (see :mod:`render.i18n`) and
+    renders to ``<Scene>_<locale>.mp4``, again sharing the scene's cache.
+    """
+    variant = [part for part in (pacing and pacing.name, locale) if part]
+    if variant:
+        overrides.setdefault("output_file", "_".join([scene_name, *variant]))
+    with tempconfig(scene_config(script, quality, **overrides)), use_locale(script, locale):
+        scene_class = load_scenes(script)[scene_name]
+        if pacing is not None:
+            scene_class = paced(scene_class, pacing)
+        scene_class = batched(scene_class)
+        scene = scene_class(renderer=renderer_class())
+        scene.render()
+        movie = getattr(scene.renderer.file_writer, "movie_file_path", None)
+        # Scenes without plays only save their last frame as an image.
+        wrote_movie = config.write_to_movie and movie is not None and movie.exists()
+        if profile and wrote_movie and movie.suffix == ".mp4" and not config.transparent:
+            tune_movie(movie, Path(script).resolve().parent, scene_name, retune=retune)
+            reindex_chapters(movie)
+        return scene
+
+
+def variants(script, pacings=(), locales=()):
+    """``(pacing, locale)`` pairs to render, the plain render first.
+
+    ``"all"`` among ``locales`` stands for every locale with a catalog.
+    """
+    if "all" in locales:
+        locales = available_locales(script)
+    return [(pacing, locale) for pacing in [None, *pacings] for locale in [None, *locales]]
+
+
+def render_variants(script, scene_name, quality="medium_quality", pacings=(), locales=(), **kwargs):
+    """Render a scene and its pacing and locale variants; returns the rendered scenes.
+
+    The plain render goes first and fills the cache the variants take
+    their unchanged plays from.
+    """
+    pairs = variants(script, pacings, locales)
+    # Every variant keeps its own plays in the shared cache; don't evict them mid-batch.
+    kwargs.setdefault("max_files_cached", 100 * len(pairs))
+    return [
+        render_scene(script, scene_name, quality, pacing=pacing, locale=locale, **kwargs)
+        for pacing, locale in pairs
+    ]
@@ -0,0 +1,92 @@
+"""Chapter index for a scene's movie, from the sections marked in ``construct()``.
+
+A lesson marks its chapters with manim's own sections::
+
+    self.next_section("The visual proof")
+
+Each section starts with a play, and every play starts its partial movie
+on a keyframe, so each chapter starts on a keyframe of the combined movie
+too. The writer counts the frames of the plays in each section and, once
+the movie is written, saves ``<movie>.chapters.json`` next to it::
+
+    {"movie": "PythagoreanProof.mp4", "frame_rate": 30, "chapters": [
+        {"name": "The visual proof", "start": 21.5, "frame": 645, "offset": 581273}, ...]}
+
+``offset`` is the byte position of the chapter's keyframe in the file.
+Final movies are written with the ``moov`` index at the front, so a
+player seeking to ``start`` gets the index with its first request and
+then fetches from ``offset`` with a single range request instead of
+buffering the movie from the beginning. The lesson decks read this file
+to build their chapter lists (see ``lessons/*/index.html``).
+
+Re-encoding a movie (see :mod:`render.profiles`) keeps its keyframes but
+moves their bytes, so the index is rebuilt with :func:`reindex_chapters`.
+"""
+
+import json
+from pathlib import Path
+
+import av
+
+# manim's first section, created before construct() marks any.
+AUTOCREATED = "autocreated"
+
+
+def chapters_path(movie):
+    movie = Path(movie)
+    return movie.with_name(f"{movie.stem}.chapters.json")
+
+
+def movie_frames(path):
+    """Number of video frames in a movie file."""
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        if stream.frames:
+            return stream.frames
+        return sum(1 for packet in container.demux(stream) if packet.size)
+
+
+def keyframes(movie):
+    """``{frame: (seconds, byte_offset)}`` for every keyframe of ``movie``, and its frame rate."""
+    with av.open(str(movie)) as container:
+        stream = container.streams.video[0]
+        fps = stream.guessed_rate or stream.average_rate
+        start = stream.start_time or 0
+        packets = sorted(
+            (packet.pts, packet.is_keyframe, packet.pos)
+            for packet in container.demux(stream) if packet.pts is not None
+        )
+        # Frames are numbered in presentation order; the rate of a concatenated
+        # movie is only approximate, so don't derive frame numbers from it.
+        found = {
+            frame: (float((pts - start) * stream.time_base), pos)
+            for frame, (pts, keyframe, pos) in enumerate(packets) if keyframe
+        }
+    return found, fps
+
+
+def index_chapters(movie, chapters):
+    """Write the chapter index for ``movie`` from ``[(name, first_frame)]``.
+
+    Raises ``ValueError`` for a chapter that doesn't start on a keyframe.
+    """
+    found, fps = keyframes(movie)
+    entries = []
+    for name, frame in chapters:
+        if frame not in found:
+            # Every play starts on a keyframe, so the frame count is off.
+            raise ValueError(f"chapter {name!r} of {Path(movie).name} starts at frame {frame}, not on a keyframe")
+        start, offset = found[frame]
+        entries.append({"name": name, "start": round(start, 3), "frame": frame, "offset": offset})
+    index = {"movie": Path(movie).name, "frame_rate": float(fps), "chapters": entries}
+    chapters_path(movie).write_text(json.dumps(index, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    return entries
+
+
+def reindex_chapters(movie):
+    """Refresh the byte offsets of an existing index after ``movie`` was re-encoded."""
+    path = chapters_path(movie)
+    if not path.exists():
+        return None
+    chapters = json.loads(path.read_text(encoding="utf-8"))["chapters"]
+    return index_chapters(movie, [(chapter["name"], chapter["frame"]) for chapter in chapters])
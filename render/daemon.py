@@ -0,0 +1,317 @@
+"""Long-lived render server: ``python -m render.daemon serve``.
+
+A fresh ``python -m render`` pays for importing manim, starting Cairo and
+Pango and loading fonts before it draws a single frame; for short scenes
+that is most of the run. The daemon keeps a pool of worker processes that
+have already done all of that and hands them scene jobs over local HTTP.
+Workers also keep the lesson modules they have imported (see
+:func:`~.build.load_scenes`), and the text SVG cache stays on disk in each
+lesson's ``media/texts`` as before. When any module of ``render`` itself
+changes on disk, or a worker dies, the pool is replaced with fresh workers
+before the next job. Workers are spawned rather than forked, so a new one
+imports the render code from disk instead of inheriting the daemon's.
+
+Submit jobs and read metrics with the same module::
+
+    python -m render.daemon render lessons/pythagorean-theorem/pythagorean_proof.py NumericExample
+    python -m render.daemon metrics
+
+Endpoints: ``POST /render`` with ``{"script", "scenes", "quality",
+"profile", "retune", "pacing", "locale", "cache"}`` answers once the
+scenes are done; ``pacing`` and ``locale`` are lists, as for ``python -m
+render``, and each scene's variants run in order on one worker so they
+reuse its cached plays. ``GET /metrics`` reports queue depth, job counts
+and latency percentiles.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .build import QUALITY_FLAGS
+from .pacing import PACINGS, Pacing
+
+HOST = "127.0.0.1"
+PORT = 8765
+RENDER_DIR = Path(__file__).resolve().parent
+
+
+def _code_version():
+    """Modification times of the ``render`` modules the workers have imported."""
+    return tuple(sorted((path.name, path.stat().st_mtime_ns) for path in RENDER_DIR.glob("*.py")))
+
+
+def _warm_up():
+    """Pool initializer: import manim and lay out some text once."""
+    from manim import Text, tempconfig
+
+    from . import build  # noqa: F401
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({"media_dir": media_dir}):
+        Text("warm up", font_size=48)
+
+
+def _render_job(script, scene_name, quality, profile=False, retune=False, pacing=(), locale=(), cache=None):
+    from .build import render_variants
+    from .remote_cache import use_remote_cache
+
+    started = time.time()
+    with use_remote_cache(cache):
+        scenes = render_variants(
+            script, scene_name, quality, [Pacing.parse(spec) for spec in pacing], locale,
+            profile=profile, retune=retune,
+        )
+    movies = [getattr(scene.renderer.file_writer, "movie_file_path", None) for scene in scenes]
+    return {
+        "scene": scene_name,
+        "movies": [str(movie) for movie in movies if movie],
+        "pid": os.getpid(),
+        "started": started,
+        "finished": time.time(),
+    }
+
+
+class Metrics:
+    """Queue depth, job counts and latencies, shared by the request threads."""
+    window = 500
+
+    def __init__(self, workers):
+        self.lock = threading.Lock()
+        self.workers = workers
+        self.queued = 0
+        self.done = 0
+        self.failed = 0
+        self.waits = []
+        self.runs = []
+        self.started = time.time()
+
+    def submitted(self):
+        with self.lock:
+            self.queued += 1
+
+    def finished(self, submitted, result=None):
+        with self.lock:
+            self.queued -= 1
+            if result is None:
+                self.failed += 1
+                return
+            self.done += 1
+            self.waits = (self.waits + [result["started"] - submitted])[-self.window:]
+            self.runs = (self.runs + [result["finished"] - result["started"]])[-self.window:]
+
+    @staticmethod
+    def _percentiles(values):
+        if not values:
+            return None
+        ordered = sorted(values)
+
+        def pick(q):
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+        return {"p50": pick(0.5), "p95": pick(0.95), "max": round(ordered[-1], 3)}
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "pending": self.queued,
+                "done": self.done,
+                "failed": self.failed,
+                "uptime": round(time.time() - self.started, 1),
+                "queue_wait": self._percentiles(self.waits),
+                "render_time": self._percentiles(self.runs),
+            }
+
+
+class RenderDaemon(ThreadingHTTPServer):
+    """HTTP server that runs scene jobs on a pool of warm worker processes."""
+    daemon_threads = True
+    # A forked worker would keep the modules this process already imported,
+    # and forking from a request thread can copy a lock another thread holds.
+    mp_context = multiprocessing.get_context("spawn")
+    warm_up = staticmethod(_warm_up)
+    run_job = staticmethod(_render_job)
+
+    def __init__(self, address=(HOST, PORT), workers=None):
+        super().__init__(address, RenderHandler)
+        self.workers = workers or os.cpu_count()
+        self.metrics = Metrics(self.workers)
+        self.pool_lock = threading.Lock()
+        self.pool = None
+        self.ensure_pool()
+
+    def start_pool(self):
+        self.code_version = _code_version()
+        self.pool = ProcessPoolExecutor(self.workers, mp_context=self.mp_context, initializer=self.warm_up)
+        # Start every worker now so the first job finds them warm.
+        for future in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def ensure_pool(self, broken=None):
+        """The worker pool, replaced first if ``broken`` or the render code changed.
+
+        Jobs already running on a replaced pool are left to finish.
+        """
+        with self.pool_lock:
+            if self.pool is None:
+                self.start_pool()
+            elif self.pool is broken or self.code_version != _code_version():
+                self.pool.shutdown(wait=False, cancel_futures=False)
+                self.start_pool()
+            return self.pool
+
+    def render(self, job):
+        quality = QUALITY_FLAGS.get(job.get("quality", "m"), job.get("quality"))
+        options = {key: job[key] for key in ("profile", "retune", "pacing", "locale", "cache") if key in job}
+        pool = self.ensure_pool()
+        futures = []
+        for name in job["scenes"]:
+            self.metrics.submitted()
+            submitted = time.time()
+            try:
+                future = pool.submit(self.run_job, job["script"], name, quality, **options)
+            except BrokenProcessPool as error:
+                future = error
+            futures.append((name, submitted, future))
+        results = []
+        for name, submitted, future in futures:
+            try:
+                if isinstance(future, Exception):
+                    raise future
+                result = future.result()
+            except Exception as error:
+                if isinstance(error, BrokenProcessPool):
+                    # A worker died (crash, OOM kill); the next job gets a new pool.
+                    self.ensure_pool(broken=pool)
+                self.metrics.finished(submitted)
+                results.append({"scene": name, "error": repr(error)})
+            else:
+                self.metrics.finished(submitted, result)
+                results.append(result)
+        return results
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    def send_json(self, status, payload):
+        body = json.dumps(payload, indent=2).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self.send_json(200, self.server.metrics.snapshot())
+        else:
+            self.send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self.send_json(404, {"error": "not found"})
+            return
+        try:
+            job = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if not job.get("scenes"):
+                from .build import load_scenes
+                job["scenes"] = list(load_scenes(job["script"]))
+            for spec in job.get("pacing", ()):
+                Pacing.parse(spec)
+        except (ValueError, KeyError, OSError) as error:
+            self.send_json(400, {"error": repr(error)})
+            return
+        results = self.server.render(job)
+        self.send_json(500 if any("error" in r for r in results) else 200, results)
+
+
+def request(path, payload=None, host=HOST, port=PORT):
+    """Call the daemon; ``payload`` makes it a POST."""
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(f"http://{host}:{port}{path}", data=data)
+    req.add_header("Content-Type", "application/json")
+    try:
+        with urllib.request.urlopen(req) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return json.loads(error.read())
+
+
+def _pacing_spec(spec):
+    Pacing.parse(spec)  # reject bad specs here rather than on a worker
+    return spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.daemon", description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=PORT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="start the daemon")
+    serve.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    submit = commands.add_parser("render", help="render scenes on a running daemon")
+    submit.add_argument("script")
+    submit.add_argument("scenes", nargs="*", help="scenes to render (default: all)")
+    submit.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="m")
+    submit.add_argument("--profile", action="store_true")
+    submit.add_argument("--retune", action="store_true")
+    submit.add_argument(
+        "--pacing", action="append", default=[], type=_pacing_spec,
+        help=f"also render a pacing variant: {', '.join(PACINGS)} or e.g. wait=1.5,run_time=1.2 (repeatable)",
+    )
+    submit.add_argument("--locale", action="append", default=[], help="also render a locale, or 'all' (repeatable)")
+    submit.add_argument("--cache", metavar="URL", default=None, help="shared render cache server for the workers")
+    commands.add_parser("metrics", help="print queue and latency metrics")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = RenderDaemon((HOST, args.port), args.workers)
+        print(f"Render daemon on http://{HOST}:{args.port} with {server.metrics.workers} warm workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+    if args.command == "metrics":
+        print(json.dumps(request("/metrics", port=args.port), indent=2))
+        return 0
+
+    results = request("/render", {
+        "script": os.path.abspath(args.script),
+        "scenes": args.scenes,
+        "quality": args.quality,
+        "profile": args.profile or args.retune,
+        "retune": args.retune,
+        "pacing": args.pacing,
+        "locale": args.locale,
+        "cache": args.cache,
+    }, port=args.port)
+    if isinstance(results, dict):
+        print(results["error"], file=sys.stderr)
+        return 1
+    for result in results:
+        if "error" in result:
+            print(f"{result['scene']}: failed: {result['error']}", file=sys.stderr)
+        else:
+            movies = ", ".join(result["movies"]) or "no movie"
+            print(f"{result['scene']}: {result['finished'] - result['started']:.2f}s -> {movies}")
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
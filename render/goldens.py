@@ -0,0 +1,182 @@
+"""Golden-frame regression checks: ``python -m render.goldens [--update] [script ...]``.
+
+Each scene is run with :class:`~.SnapshotRenderer`, which jumps every play
+to its end instead of rendering it, so only the frame each play ends on is
+drawn. Those frames are reduced to perceptual hashes and compared with the
+goldens stored next to the lesson in ``goldens/<Scene>.json``. Scenes run in
+parallel, one process each.
+
+A golden also keeps a small greyscale thumbnail of every frame, so a
+failing frame gets a diff image (golden, current, amplified difference)
+under ``media/golden_diffs/<Scene>/``.
+
+A scene with no golden yet has its frames recorded and is reported as
+such rather than as a pass; ``--strict`` (for CI) fails the run on it.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from manim import tempconfig
+from PIL import Image
+
+from .build import lesson_scripts, load_scenes, scene_config
+from .renderer import SnapshotRenderer
+
+GOLDENS_DIR = "goldens"
+DIFFS_DIR = Path("media") / "golden_diffs"
+QUALITY = "low_quality"
+HASH_SIZE = 16
+# Bits of the HASH_SIZE**2-bit hash that may flip before a frame fails.
+TOLERANCE = 6
+THUMBNAIL_WIDTH = 240
+
+
+def _gray(frame):
+    return Image.fromarray(np.asarray(frame)[..., :3]).convert("L")
+
+
+def phash(frame, size=HASH_SIZE):
+    """DCT perceptual hash of an RGB(A) frame, as a hex string of ``size**2`` bits."""
+    pixels = np.asarray(_gray(frame).resize((size * 4, size * 4), Image.BOX), dtype=float)
+    n = size * 4
+    k = np.arange(n)
+    dct = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+    low = (dct @ pixels @ dct.T)[:size, :size].ravel()
+    # The DC term only tracks overall brightness.
+    bits = low > np.median(low[1:])
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):0{size * size // 4}x}"
+
+
+def distance(a, b):
+    """Number of differing bits between two hashes."""
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+def thumbnail(frame, width=THUMBNAIL_WIDTH):
+    image = _gray(frame)
+    return image.resize((width, round(image.height * width / image.width)), Image.BOX)
+
+
+def snapshot_scene(script, scene_name, quality=QUALITY):
+    """``(time, hash, thumbnail)`` for the frame each play of the scene ends on."""
+    with tempfile.TemporaryDirectory() as media_dir:
+        options = scene_config(
+            script, quality,
+            media_dir=media_dir, write_to_movie=False, save_last_frame=False, disable_caching=True,
+        )
+        with tempconfig(options):
+            scene = load_scenes(script)[scene_name](renderer=SnapshotRenderer())
+            scene.render()
+            snapshots = scene.renderer.snapshots
+    return [(round(time, 4), phash(frame), thumbnail(frame)) for time, frame in snapshots]
+
+
+def golden_path(script, scene_name):
+    return Path(script).resolve().parent / GOLDENS_DIR / f"{scene_name}.json"
+
+
+def thumbnail_path(script, scene_name, play):
+    return Path(script).resolve().parent / GOLDENS_DIR / scene_name / f"play_{play:03d}.png"
+
+
+def update_golden(script, scene_name, snapshots, quality=QUALITY):
+    path = golden_path(script, scene_name)
+    path.parent.mkdir(exist_ok=True)
+    for stale in thumbnail_path(script, scene_name, 0).parent.glob("play_*.png"):
+        stale.unlink()
+    frames = []
+    for play, (time, hash_, image) in enumerate(snapshots):
+        image_path = thumbnail_path(script, scene_name, play)
+        image_path.parent.mkdir(exist_ok=True)
+        image.save(image_path, optimize=True)
+        frames.append({"play": play, "time": time, "hash": hash_})
+    golden = {"quality": quality, "hash_size": HASH_SIZE, "frames": frames}
+    path.write_text(json.dumps(golden, indent=2) + "\n")
+
+
+def write_diff(script, scene_name, play, image):
+    """Golden, current and 4x difference side by side; returns the image path."""
+    golden_image = Image.open(thumbnail_path(script, scene_name, play)).convert("L")
+    current = np.asarray(image.resize(golden_image.size, Image.BOX), dtype=np.int16)
+    golden_pixels = np.asarray(golden_image, dtype=np.int16)
+    diff = np.clip(np.abs(current - golden_pixels) * 4, 0, 255)
+    strip = np.hstack([golden_pixels, current, diff]).astype(np.uint8)
+    path = Path(script).resolve().parent / DIFFS_DIR / scene_name / f"play_{play:03d}.png"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(strip).save(path)
+    return path
+
+
+def compare(script, scene_name, snapshots, tolerance=TOLERANCE):
+    """Per-frame results against the stored golden, writing diffs for failures."""
+    golden = json.loads(golden_path(script, scene_name).read_text())
+    results = []
+    for play in range(max(len(golden["frames"]), len(snapshots))):
+        expected = golden["frames"][play] if play < len(golden["frames"]) else None
+        actual = snapshots[play] if play < len(snapshots) else None
+        if expected is None or actual is None:
+            results.append({"play": play, "status": "missing" if actual is None else "extra"})
+            continue
+        time, hash_, image = actual
+        bits = distance(expected["hash"], hash_)
+        result = {"play": play, "time": time, "distance": bits, "status": "ok"}
+        if bits > tolerance:
+            result["status"] = "changed"
+            result["diff"] = str(write_diff(script, scene_name, play, image))
+        results.append(result)
+    return results
+
+
+def check_scene(script, scene_name, update=False):
+    """Snapshot one scene and either store it as the golden or compare against it.
+
+    Returns ``(script, scene_name, outcome, results)``: ``outcome`` is
+    ``"stored"`` for ``update``, ``"recorded"`` when there was no golden
+    to compare with, and ``"compared"`` with per-frame ``results`` otherwise.
+    """
+    snapshots = snapshot_scene(script, scene_name)
+    if update or not golden_path(script, scene_name).exists():
+        update_golden(script, scene_name, snapshots)
+        return script, scene_name, "stored" if update else "recorded", None
+    return script, scene_name, "compared", compare(script, scene_name, snapshots)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.goldens", description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", help="lesson scripts to check (default: all)")
+    parser.add_argument("--update", action="store_true", help="store the current frames as the goldens")
+    parser.add_argument("--strict", action="store_true", help="fail scenes that have no golden yet (for CI)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="parallel scenes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    scripts = [Path(script) for script in args.scripts] or lesson_scripts()
+    jobs = [(script, name) for script in scripts for name in load_scenes(script)]
+    failed = 0
+    with ProcessPoolExecutor(args.jobs) as pool:
+        futures = [pool.submit(check_scene, script, name, args.update) for script, name in jobs]
+        for future in futures:
+            script, name, outcome, results = future.result()
+            if outcome == "stored":
+                print(f"{name}: golden stored")
+                continue
+            if outcome == "recorded":
+                print(f"{name}: recorded (no golden)")
+                failed += args.strict
+                continue
+            bad = [result for result in results if result["status"] != "ok"]
+            failed += bool(bad)
+            print(f"{name}: {len(results) - len(bad)}/{len(results)} frames match")
+            for result in bad:
+                detail = f"{result['distance']} bits, diff {result['diff']}" if "diff" in result else result["status"]
+                print(f"  play {result['play']}: {detail}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
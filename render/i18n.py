@@ -0,0 +1,119 @@
+"""Caption translations for the lesson scenes.
+
+Lesson scripts wrap their prose in :func:`gettext`, imported as ``_`` as
+with the standard library's gettext::
+
+    from render.i18n import gettext as _
+
+    step2 = Text(_("Step 2: Place 4 a-b-c right triangles"), font_size=28)
+
+With no locale active it returns the English text, so the scripts
+still render unchanged with plain ``manim``. ``python -m render --locale
+es`` looks every string up in ``locales/es.json`` in the lesson folder.
+That file maps each English string to its translation; missing or empty
+entries fall back to English.
+
+All locales share the scene's partial movie cache. A play is hashed from
+the mobjects on screen, so a play with no translated text on screen hashes
+the same in every language and is rendered only once. Each locale is
+written to ``<Scene>_<locale>.mp4``.
+
+``python -m render.i18n update <script> <locale>`` adds any new ``_``
+strings of a script to that locale's catalog, so translators only fill in
+blanks; ``python -m render.i18n extract <script>`` just lists them.
+"""
+
+import argparse
+import ast
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+LOCALES_DIR = "locales"
+
+_catalog = {}
+
+
+def gettext(text):
+    """``text`` in the active locale, or unchanged when it has no translation."""
+    return _catalog.get(text) or text
+
+
+def catalog_path(script, locale):
+    return Path(script).resolve().parent / LOCALES_DIR / f"{locale}.json"
+
+
+def available_locales(script):
+    """Locales that have a catalog next to ``script``."""
+    return sorted(path.stem for path in (Path(script).resolve().parent / LOCALES_DIR).glob("*.json"))
+
+
+def load_catalog(script, locale):
+    path = catalog_path(script, locale)
+    if not path.exists():
+        raise FileNotFoundError(f"no {locale!r} catalog for {Path(script).name} (expected {path})")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@contextmanager
+def use_locale(script, locale):
+    """Make :func:`gettext` translate into ``locale`` (``None`` for English) while active."""
+    global _catalog
+    previous = _catalog
+    _catalog = load_catalog(script, locale) if locale else {}
+    try:
+        yield
+    finally:
+        _catalog = previous
+
+
+def extract(script):
+    """The literal strings passed to ``_`` or ``gettext`` in ``script``, in source order."""
+    tree = ast.parse(Path(script).read_text(encoding="utf-8"))
+    strings = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in ("_", "gettext")
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            strings.append((node.lineno, node.args[0].value))
+    return list(dict.fromkeys(text for _, text in sorted(strings)))
+
+
+def update_catalog(script, locale):
+    """Add the script's untranslated strings to the catalog as empty entries."""
+    path = catalog_path(script, locale)
+    catalog = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    added = [text for text in extract(script) if text not in catalog]
+    catalog.update(dict.fromkeys(added, ""))
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(catalog, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.i18n", description="Maintain caption catalogs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    extract_cmd = commands.add_parser("extract", help="list a script's translatable strings")
+    extract_cmd.add_argument("script")
+    update = commands.add_parser("update", help="add a script's new strings to a locale's catalog")
+    update.add_argument("script")
+    update.add_argument("locale", help="e.g. es; writes locales/<locale>.json next to the script")
+    args = parser.parse_args(argv)
+
+    if args.command == "extract":
+        for text in extract(args.script):
+            print(json.dumps(text, ensure_ascii=False))
+        return 0
+    added = update_catalog(args.script, args.locale)
+    print(f"{len(added)} new strings in {catalog_path(args.script, args.locale)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Vectorized interpolation for plays made of several Transforms."""
+
+import numpy as np
+from manim import Animation, Mobject, Transform, VMobject
+from manim.utils.paths import STRAIGHT_PATH_THRESHOLD
+
+COLOR_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+COLOR_SCALARS = ("stroke_width", "background_stroke_width", "sheen_factor")
+
+
+def _is_plain_transform(anim):
+    cls = type(anim)
+    return (
+        isinstance(anim, Transform)
+        and cls.interpolate is Animation.interpolate
+        and cls.interpolate_mobject is Animation.interpolate_mobject
+        and cls.interpolate_submobject is Transform.interpolate_submobject
+        and anim.lag_ratio == 0
+        and anim.path_arc_centers is None
+    )
+
+
+def _is_plain_vmobject(mob):
+    cls = type(mob)
+    return (
+        isinstance(mob, VMobject)
+        and cls.interpolate is Mobject.interpolate
+        and cls.interpolate_color is VMobject.interpolate_color
+    )
+
+
+def _unit_axis(axis):
+    axis = np.asarray(axis, dtype=float)
+    norm = np.linalg.norm(axis)
+    return axis / norm if norm else np.array([0.0, 0.0, 1.0])
+
+
+def _rotate(vectors, axes, angles):
+    """Rotate each row of ``vectors`` about the matching unit axis (Rodrigues)."""
+    cos = np.cos(angles)[:, None]
+    sin = np.sin(angles)[:, None]
+    dots = np.einsum("ij,ij->i", axes, vectors)[:, None]
+    return vectors * cos + np.cross(axes, vectors) * sin + axes * dots * (1 - cos)
+
+
+class ArcPaths:
+    """Row-wise ``path_along_arc`` with the rotation centres computed once."""
+    def __init__(self, start_points, end_points, angles, axes):
+        self.start_points = start_points
+        self.end_points = end_points
+        self.arc_rows = np.abs(angles) >= STRAIGHT_PATH_THRESHOLD
+        start = start_points[self.arc_rows]
+        vects = end_points[self.arc_rows] - start
+        self.axes = axes[self.arc_rows]
+        self.angles = angles[self.arc_rows]
+        centers = start + 0.5 * vects
+        # Same centres as manim's path_along_arc; a half turn needs no offset.
+        bent = self.angles != np.pi
+        centers[bent] += (
+            np.cross(self.axes[bent], vects[bent] / 2.0) / np.tan(self.angles[bent] / 2)[:, None]
+        )
+        self.centers = centers
+        self.offsets = start - centers
+
+    def __call__(self, row_alphas):
+        row_alphas = row_alphas[:, None]
+        points = (1 - row_alphas) * self.start_points + row_alphas * self.end_points
+        if self.arc_rows.any():
+            angles = row_alphas[self.arc_rows, 0] * self.angles
+            points[self.arc_rows] = self.centers + _rotate(self.offsets, self.axes, angles)
+        return points
+
+
+def _path_matches(anim):
+    """Check that the animation's path_func is the arc :class:`ArcPaths` reproduces."""
+    start = np.array([[0.3, -1.2, 0.0], [2.0, 0.5, 0.1]])
+    end = np.array([[1.7, 0.4, 0.0], [-1.0, 2.5, 0.1]])
+    angles = np.full(2, float(anim.path_arc))
+    axes = np.tile(_unit_axis(anim.path_arc_axis), (2, 1))
+    expected = anim.path_func(start, end, 0.37)
+    return np.allclose(ArcPaths(start, end, angles, axes)(np.full(2, 0.37)), expected)
+
+
+class TransformBatch:
+    """All family members of a set of Transforms, packed into flat arrays.
+
+    Every submobject contributes a run of rows to shared point and colour
+    arrays. Arc paths keep their rotation centres precomputed, so the
+    arithmetic of a frame is a handful of NumPy operations over the whole
+    batch instead of one ``Mobject.interpolate`` and path function call per
+    submobject. Handing each submobject its rows back is still a short
+    Python loop of attribute assignments per submobject; that part stays
+    O(N), it just no longer does any maths.
+    """
+    def __init__(self, animations):
+        self.animations = list(animations)
+        self.ids = {id(anim) for anim in self.animations}
+        self.members = []
+
+        starts, ends, point_anims = [], [], []
+        arcs, axes = [], []
+        colors = {attr: ([], [], []) for attr in COLOR_ARRAYS}
+        scalars = {attr: ([], []) for attr in COLOR_SCALARS + ("sheen_direction",)}
+
+        for index, anim in enumerate(self.animations):
+            arcs.append(anim.path_arc)
+            axes.append(_unit_axis(anim.path_arc_axis))
+            for sub, start, target in anim.get_all_families_zipped():
+                rows = {"points": len(start.points)}
+                starts.append(start.points)
+                ends.append(target.points)
+                point_anims.append(np.full(len(start.points), index))
+                for attr, (a0, a1, owners) in colors.items():
+                    value = getattr(start, attr)
+                    a0.append(value)
+                    a1.append(getattr(target, attr))
+                    owners.append(np.full(len(value), index))
+                    rows[attr] = len(value)
+                for attr, (v0, v1) in scalars.items():
+                    v0.append(getattr(start, attr))
+                    v1.append(getattr(target, attr))
+                self.members.append((sub, index, rows))
+
+        self.point_anims = np.concatenate(point_anims)
+        self.paths = ArcPaths(
+            np.concatenate(starts),
+            np.concatenate(ends),
+            np.array(arcs, dtype=float)[self.point_anims],
+            np.array(axes)[self.point_anims],
+        )
+        self.colors = {
+            attr: (np.concatenate(a0), np.concatenate(a1), np.concatenate(owners))
+            for attr, (a0, a1, owners) in colors.items()
+        }
+        self.scalars = {
+            attr: (np.array(v0, dtype=float), np.array(v1, dtype=float))
+            for attr, (v0, v1) in scalars.items()
+        }
+        self.member_anims = np.array([index for _, index, _ in self.members])
+        # Row slices of every member, and which members belong to each animation.
+        offsets = dict.fromkeys(("points",) + COLOR_ARRAYS, 0)
+        self.slices = []
+        for _, _, rows in self.members:
+            slices = {}
+            for attr, n in rows.items():
+                slices[attr] = slice(offsets[attr], offsets[attr] + n)
+                offsets[attr] += n
+            self.slices.append(slices)
+        self.anim_members = {
+            id(anim): [i for i, (_, index, _) in enumerate(self.members) if index == anim_index]
+            for anim_index, anim in enumerate(self.animations)
+        }
+        self.state = None
+
+    @classmethod
+    def collect(cls, animations):
+        """Batch the plain Transforms among ``animations``, or return ``None``."""
+        candidates = []
+        for anim in animations:
+            if not _is_plain_transform(anim):
+                continue
+            families = list(anim.get_all_families_zipped())
+            if all(
+                _is_plain_vmobject(sub)
+                and len(start.points) == len(target.points)
+                and all(len(getattr(start, attr)) == len(getattr(target, attr)) for attr in COLOR_ARRAYS)
+                and all(np.ndim(getattr(start, attr)) == 0 for attr in COLOR_SCALARS)
+                # Updaters would move the start or target after they were packed.
+                and not start.updaters
+                and not target.updaters
+                for sub, start, target in families
+            ) and _path_matches(anim):
+                candidates.append((anim, len(families)))
+        if sum(size for _, size in candidates) < 2:
+            return None
+        return cls(anim for anim, _ in candidates)
+
+    def __contains__(self, anim):
+        return id(anim) in self.ids
+
+    def compute(self, alphas):
+        """Work out every batched submobject's state at the per-animation ``alphas``.
+
+        Nothing is written to the submobjects until :meth:`apply`.
+        """
+        alphas = np.array(
+            [anim.get_sub_alpha(alpha, 0, 1) for anim, alpha in zip(self.animations, alphas)]
+        )
+        points = self.paths(alphas[self.point_anims])
+        colors = {}
+        for attr, (a0, a1, owners) in self.colors.items():
+            row_alphas = alphas[owners][:, None]
+            colors[attr] = (1 - row_alphas) * a0 + row_alphas * a1
+        member_alphas = alphas[self.member_anims]
+        scalars = {}
+        for attr, (v0, v1) in self.scalars.items():
+            weights = member_alphas.reshape((-1,) + (1,) * (v0.ndim - 1))
+            scalars[attr] = (1 - weights) * v0 + weights * v1
+        self.state = points, colors, scalars
+
+    def apply(self, anim):
+        """Hand the submobjects of one batched animation their computed state."""
+        points, colors, scalars = self.state
+        for i in self.anim_members[id(anim)]:
+            sub, slices = self.members[i][0], self.slices[i]
+            sub.points = points[slices["points"]]
+            for attr in COLOR_ARRAYS:
+                setattr(sub, attr, colors[attr][slices[attr]])
+            for attr in COLOR_SCALARS:
+                setattr(sub, attr, float(scalars[attr][i]))
+            sub.sheen_direction = scalars["sheen_direction"][i]
+
+    def interpolate(self, alphas):
+        """Set every batched submobject to its state at the per-animation ``alphas``."""
+        self.compute(alphas)
+        for anim in self.animations:
+            self.apply(anim)
+
+
+class BatchedScene:
+    """Scene mixin that runs the Transforms of each play as one :class:`TransformBatch`.
+
+    Everything else in the play goes through the usual per-animation path.
+    The batch is computed once per frame, but each Transform's submobjects
+    are only written when the loop reaches that Transform, so animations
+    and updaters see the same intermediate states as with stock manim. Each
+    Transform's own ``finish()`` still runs at the end, so final states are
+    exactly what stock manim produces.
+    """
+    def begin_animations(self):
+        super().begin_animations()
+        self.transform_batch = TransformBatch.collect(self.animations)
+
+    def update_to_time(self, t):
+        batch = getattr(self, "transform_batch", None)
+        if batch is None:
+            return super().update_to_time(t)
+        dt = t - self.last_t
+        self.last_t = t
+        # Batched Transforms have no updaters on what they interpolate between,
+        # so their state for this frame doesn't depend on the loop below.
+        batch.compute([t / anim.run_time for anim in batch.animations])
+        for animation in self.animations:
+            animation.update_mobjects(dt)
+            if animation in batch:
+                batch.apply(animation)
+            else:
+                animation.interpolate(t / animation.run_time)
+        self.update_mobjects(dt)
+        self.update_meshes(dt)
+        self.update_self(dt)
+
+
+def batched(scene_class):
+    """``scene_class`` with :class:`BatchedScene` mixed in, keeping its name."""
+    return type(scene_class.__name__, (BatchedScene, scene_class), {"__module__": scene_class.__module__})
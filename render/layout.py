@@ -0,0 +1,258 @@
+"""Layout checks over a scene's whole timeline: ``python -m render.layout [script ...]``.
+
+Each scene runs under :class:`~.LayoutRenderer`, which skips every play to
+its end without drawing. At each play boundary the visible mobjects go
+into a :class:`GridIndex` and three things are checked:
+
+* **overlap**: two captions or labels whose boxes intersect, or a shape
+  outline running through a caption (a label sitting inside a filled
+  shape is fine, so fills don't count).
+* **out of frame**: anything that reaches past the edge of the frame.
+* **small text**: text whose tallest glyph is under ``MIN_TEXT_PX``
+  pixels at the checked resolution.
+
+An issue is reported once, at the first play where it appears, with the
+number of plays it lasts. ``--locale`` also checks the translated
+captions, which are usually the ones that run long. ``--pacing`` checks a
+pacing variant too: it only rescales run times, so its layouts match the
+plain run's unless something on screen is driven by time, but the times
+reported are the variant's.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from manim import MarkupText, SingleStringMathTex, Text, VMobject, tempconfig
+
+from .build import lesson_scripts, load_scenes, scene_config, variants
+from .i18n import available_locales, use_locale
+from .pacing import PACINGS, Pacing, paced
+from .renderer import LayoutRenderer
+
+TEXT_TYPES = (Text, MarkupText, SingleStringMathTex)
+CELL = 0.5  # grid cell size, in scene units
+MIN_TEXT_PX = 9
+# Boxes closer than this don't count as touching; glyph boxes are loose.
+TOLERANCE = 0.02
+# Points sampled along each cubic of a shape outline; curves become polylines.
+OUTLINE_SAMPLES = np.linspace(0, 1, 6)
+
+
+class GridIndex:
+    """Uniform grid over axis-aligned boxes, for finding what is near what."""
+    def __init__(self, cell=CELL):
+        self.cell = cell
+        self.cells = defaultdict(list)
+        self.boxes = []
+
+    def _cells(self, box):
+        (x0, y0), (x1, y1) = np.floor(np.asarray(box) / self.cell).astype(int)
+        return ((i, j) for i in range(x0, x1 + 1) for j in range(y0, y1 + 1))
+
+    def insert(self, box, item):
+        index = len(self.boxes)
+        self.boxes.append((np.asarray(box), item))
+        for key in self._cells(box):
+            self.cells[key].append(index)
+        return index
+
+    def query_box(self, box):
+        """Indices of stored boxes overlapping ``box``."""
+        box = np.asarray(box)
+        found = set()
+        for key in self._cells(box):
+            for index in self.cells.get(key, ()):
+                other = self.boxes[index][0]
+                if np.all(other[0] < box[1] - TOLERANCE) and np.all(box[0] < other[1] - TOLERANCE):
+                    found.add(index)
+        return found
+
+    def query_segments(self, starts, ends):
+        """Indices of stored boxes that any segment ``starts[i] -> ends[i]`` passes through."""
+        found = set()
+        low = np.minimum(starts, ends).min(axis=0)
+        high = np.maximum(starts, ends).max(axis=0)
+        for index in self.query_box([low, high]):
+            box_low, box_high = self.boxes[index][0]
+            if _segments_hit_box(starts, ends, box_low + TOLERANCE, box_high - TOLERANCE).any():
+                found.add(index)
+        return found
+
+
+def _segments_hit_box(starts, ends, low, high):
+    """Liang-Barsky clipping of all segments against one box at once."""
+    delta = ends - starts
+    p = np.hstack([-delta, delta])
+    q = np.hstack([starts - low, high - starts])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = q / p
+    enter = np.where(p < 0, t, -np.inf).max(axis=1).clip(0, None)
+    leave = np.where(p > 0, t, np.inf).min(axis=1).clip(None, 1)
+    parallel_outside = ((p == 0) & (q < 0)).any(axis=1)
+    return (enter <= leave) & ~parallel_outside
+
+
+def _visible(mobject):
+    for vm in mobject.family_members_with_points():
+        if not isinstance(vm, VMobject):
+            return True
+        if np.any(vm.get_fill_opacities() > 0):
+            return True
+        if vm.get_stroke_width() > 0 and np.any(vm.get_stroke_opacities() > 0):
+            return True
+    return False
+
+
+def _box(mobject):
+    points = mobject.get_all_points()[:, :2]
+    return np.array([points.min(axis=0), points.max(axis=0)])
+
+
+def _name(mobject):
+    if isinstance(mobject, TEXT_TYPES):
+        text = getattr(mobject, "original_text", None) or getattr(mobject, "tex_string", None) or ""
+        return repr(text)
+    center = mobject.get_center()
+    return f"{type(mobject).__name__} at ({center[0]:.2f}, {center[1]:.2f})"
+
+
+def layout_items(scene):
+    """Visible texts, and the stroked shapes outside them, on screen now."""
+    texts, shapes = [], []
+
+    def visit(mobject):
+        if isinstance(mobject, TEXT_TYPES):
+            if len(mobject.get_all_points()) and _visible(mobject):
+                texts.append(mobject)
+            return
+        if isinstance(mobject, VMobject) and len(mobject.points) and _visible(mobject):
+            shapes.append(mobject)
+        for sub in mobject.submobjects:
+            visit(sub)
+
+    for mobject in scene.mobjects:
+        visit(mobject)
+    return texts, shapes
+
+
+def _outline(shape):
+    """A shape's stroked outline as line segments ``(starts, ends)``; empty when unstroked."""
+    if shape.get_stroke_width() == 0 or not np.any(shape.get_stroke_opacities() > 0):
+        return np.empty((0, 2)), np.empty((0, 2))
+    cubics = shape.points[: len(shape.points) // 4 * 4].reshape(-1, 4, 3)[:, :, :2]
+    t = OUTLINE_SAMPLES[:, None]
+    weights = np.hstack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])
+    polylines = np.einsum("sk,nkd->nsd", weights, cubics)
+    return polylines[:, :-1].reshape(-1, 2), polylines[:, 1:].reshape(-1, 2)
+
+
+def check_state(scene):
+    """Issues in the scene as it stands, as ``{(kind, subject): detail}``."""
+    issues = {}
+    texts, shapes = layout_items(scene)
+    index = GridIndex()
+    camera = scene.renderer.camera
+    pixels_per_unit = camera.pixel_height / camera.frame_height
+    half = np.array([camera.frame_width, camera.frame_height]) / 2
+    center = np.asarray(camera.frame_center)[:2]
+
+    for mobject in texts + shapes:
+        box = _box(mobject)
+        beyond = np.max(np.concatenate([(center - half) - box[0], box[1] - (center + half)]))
+        if beyond > TOLERANCE:
+            issues[("out of frame", _name(mobject))] = f"{beyond:.2f} units past the edge"
+
+    for text in texts:
+        box = _box(text)
+        for other in index.query_box(box):
+            names = tuple(sorted((_name(text), _name(index.boxes[other][1]))))
+            issues[("overlap", " / ".join(names))] = "text boxes intersect"
+        index.insert(box, text)
+        glyphs = text.family_members_with_points() or [text]
+        tallest = max(glyph.height for glyph in glyphs) * pixels_per_unit
+        if tallest < MIN_TEXT_PX:
+            issues[("small text", _name(text))] = f"{tallest:.1f}px tall glyphs"
+
+    for shape in shapes:
+        starts, ends = _outline(shape)
+        if len(starts):
+            for other in index.query_segments(starts, ends):
+                text = index.boxes[other][1]
+                issues[("overlap", f"{_name(shape)} / {_name(text)}")] = "outline crosses text"
+    return issues
+
+
+def check_scene(script, scene_name, quality="medium_quality", locale=None, pacing=None):
+    """Run the scene's timeline; returns ``[(kind, subject, detail, first_time, plays)]``."""
+    seen = {}
+
+    def inspect(scene, time):
+        for key, detail in check_state(scene).items():
+            if key in seen:
+                seen[key][3] += 1
+            else:
+                seen[key] = [detail, round(time, 2), scene.renderer.num_plays, 1]
+
+    with tempfile.TemporaryDirectory() as media_dir:
+        options = scene_config(
+            script, quality, media_dir=media_dir,
+            write_to_movie=False, save_last_frame=False, disable_caching=True,
+        )
+        # Texts still lay out through SVGs. Start from the lesson's, but write
+        # new ones (a locale's captions) to the scratch dir, not media/texts.
+        text_dir = Path(media_dir) / "texts"
+        lesson_texts = Path(script).resolve().parent / "media" / "texts"
+        if lesson_texts.is_dir():
+            shutil.copytree(lesson_texts, text_dir)
+        options["text_dir"] = str(text_dir)
+        with tempconfig(options), use_locale(script, locale):
+            scene_class = load_scenes(script)[scene_name]
+            if pacing is not None:
+                scene_class = paced(scene_class, pacing)
+            scene_class(renderer=LayoutRenderer(inspect)).render()
+    return [(kind, subject, detail, time, plays) for (kind, subject), (detail, time, _, plays) in seen.items()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.layout", description=__doc__.splitlines()[0])
+    parser.add_argument("scripts", nargs="*", help="lesson scripts to check (default: all)")
+    parser.add_argument("-q", "--quality", default="medium_quality", help="resolution to judge text size at")
+    parser.add_argument("--locale", action="append", default=[], help="also check a locale, or 'all' (repeatable)")
+    parser.add_argument(
+        "--pacing", action="append", default=[], type=Pacing.parse,
+        help=f"also check a pacing variant: {', '.join(PACINGS)} or e.g. wait=1.5 (repeatable)",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="parallel scenes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    scripts = [Path(script) for script in args.scripts] or lesson_scripts()
+    jobs = []
+    for script in scripts:
+        available = available_locales(script)
+        locales = available if "all" in args.locale else [loc for loc in args.locale if loc in available]
+        for name in load_scenes(script):
+            for pacing, locale in variants(script, args.pacing, locales):
+                jobs.append((script, name, locale, pacing))
+
+    found = 0
+    with ProcessPoolExecutor(args.jobs) as pool:
+        futures = [pool.submit(check_scene, script, name, args.quality, *variant) for script, name, *variant in jobs]
+        for (script, name, locale, pacing), future in zip(jobs, futures):
+            issues = future.result()
+            variant = ", ".join(part for part in (pacing and pacing.name, locale) if part)
+            label = f"{name} [{variant}]" if variant else name
+            found += len(issues)
+            print(f"{label}: {len(issues) or 'no'} layout issues")
+            for kind, subject, detail, time, plays in sorted(issues, key=lambda issue: issue[3]):
+                print(f"  {time:7.2f}s  {kind}: {subject} ({detail}; {plays} plays)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
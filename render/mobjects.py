@@ -0,0 +1,85 @@
+"""Mobjects that draw many shapes as one."""
+
+import numpy as np
+from manim import VMobject
+
+
+class PolygonBatch(VMobject):
+    """Many same-style polygons stored in one ``(N, k, 3)`` vertex array.
+
+    Every shape becomes a closed subpath of a single VMobject, so the whole
+    batch is one family member and Cairo fills and strokes it in one path
+    submission, instead of N separate ``Polygon`` mobjects.
+
+    Shapes are drawn with the nonzero winding rule as one path, so
+    overlapping shapes are painted once where they overlap rather than
+    stacking their opacity. Tilings and grids never overlap.
+
+    Parameters
+    ----------
+    shapes
+        Vertices of each shape, shape ``(N, k, 3)``; all shapes share ``k``.
+    kwargs
+        Style arguments forwarded to :class:`~.VMobject`, as for ``Polygon``.
+
+    Examples
+    --------
+    ::
+
+        triangles = PolygonBatch(
+            [[bl, bl + RIGHT * a, bl + UP * b], [br, br + UP * a, br + LEFT * b]],
+            color=BLUE, fill_color=BLUE_E, fill_opacity=0.7,
+        )
+    """
+    def __init__(self, shapes, **kwargs):
+        super().__init__(**kwargs)
+        shapes = np.array(shapes, dtype=float)
+        if shapes.ndim != 3 or shapes.shape[2] != 3:
+            raise ValueError(f"shapes must have shape (N, k, 3), got {shapes.shape}")
+        self.shape_count, self.shape_size = shapes.shape[:2]
+        self.set_shapes(shapes)
+
+    @classmethod
+    def from_transforms(cls, base, matrices=None, shifts=None, **kwargs):
+        """``N`` copies of ``base`` (``(k, 3)``), each mapped by ``matrices[i]`` then moved by ``shifts[i]``."""
+        base = np.asarray(base, dtype=float)
+        count = len(matrices) if matrices is not None else len(shifts)
+        batch = cls(np.broadcast_to(base, (count, *base.shape)), **kwargs)
+        batch.apply_to_shapes(matrices, shifts)
+        return batch
+
+    @property
+    def shapes(self):
+        """Current vertices, ``(N, k, 3)``, read back from the edge anchors.
+
+        Reading them from ``points`` keeps them right after ``shift``,
+        ``scale`` or an animation has moved the batch.
+        """
+        if len(self.points) != self.shape_count * self.shape_size * 4:
+            raise ValueError("points no longer describe the original shapes")
+        return self.points[::4].reshape(self.shape_count, self.shape_size, 3).copy()
+
+    def set_shapes(self, shapes):
+        """Rebuild the bezier points from a ``(N, k, 3)`` vertex array."""
+        start = np.asarray(shapes, dtype=float)
+        end = np.roll(start, -1, axis=1)
+        # Straight edges as cubics: anchor, thirds as handles, anchor.
+        weights = np.array([0, 1 / 3, 2 / 3, 1])[:, None]
+        edges = start[:, :, None, :] + weights * (end - start)[:, :, None, :]
+        self.points = edges.reshape(-1, 3)
+        return self
+
+    def apply_to_shapes(self, matrices=None, shifts=None, indices=slice(None)):
+        """Map the selected shapes by per-shape ``(3, 3)`` matrices and shifts, all at once."""
+        shapes = self.shapes
+        selected = shapes[indices]
+        if matrices is not None:
+            selected = np.einsum("nij,nkj->nki", np.asarray(matrices, dtype=float), selected)
+        if shifts is not None:
+            selected = selected + np.asarray(shifts, dtype=float)[:, None, :]
+        shapes[indices] = selected
+        return self.set_shapes(shapes)
+
+    def get_shape(self, index):
+        """Vertices of one shape."""
+        return self.shapes[index]
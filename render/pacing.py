@@ -0,0 +1,71 @@
+"""Slower and faster versions of a lesson from the same scene code.
+
+A :class:`Pacing` scales the run time of every play as it is compiled:
+``self.wait(...)`` holds by ``wait`` and animations by ``run_time``. Plays
+whose run time does not change hash exactly as before, so the renderer
+takes them straight from the partial movie cache. A scaled wait is a
+frozen frame, so re-emitting it costs one rasterized frame held for longer.
+Only animations whose run time really changes are rasterized again.
+
+Each variant is written next to the normal movie as ``<Scene>_<name>.mp4``
+and shares the scene's cache.
+"""
+
+from dataclasses import dataclass
+
+from manim import Wait
+
+
+@dataclass(frozen=True)
+class Pacing:
+    name: str
+    wait: float = 1.0
+    run_time: float = 1.0
+
+    @classmethod
+    def parse(cls, spec):
+        """A preset name, or ``wait=1.5,run_time=1.2`` style overrides."""
+        if spec in PACINGS:
+            return PACINGS[spec]
+        scales = {}
+        for item in spec.split(","):
+            key, _, value = item.partition("=")
+            if key.strip() not in ("wait", "run_time"):
+                raise ValueError(f"unknown pacing {spec!r}; use a preset or wait=/run_time= scales")
+            scales[key.strip()] = float(value)
+        name = "_".join(f"{key}{value:g}" for key, value in sorted(scales.items()))
+        return cls(name, **scales)
+
+    def scale(self, animation):
+        return self.wait if isinstance(animation, Wait) else self.run_time
+
+
+PACINGS = {
+    "slow": Pacing("slow", wait=1.5),
+    "fast": Pacing("fast", wait=0.67),
+}
+
+
+class PacedScene:
+    """Scene mixin that applies the class's ``pacing`` to every play."""
+    pacing = None
+
+    def compile_animations(self, *args, **kwargs):
+        animations = super().compile_animations(*args, **kwargs)
+        for animation in animations:
+            scale = self.pacing.scale(animation)
+            # Leave unscaled run times untouched so their play hashes match.
+            if scale != 1:
+                animation.run_time *= scale
+                if isinstance(animation, Wait):
+                    animation.duration = animation.run_time
+        return animations
+
+
+def paced(scene_class, pacing):
+    """``scene_class`` with :class:`PacedScene` mixed in for ``pacing``, keeping its name."""
+    return type(
+        scene_class.__name__,
+        (PacedScene, scene_class),
+        {"__module__": scene_class.__module__, "pacing": pacing},
+    )
@@ -0,0 +1,153 @@
+"""Catalog thumbnails and animated previews sampled while a scene renders.
+
+Frames are picked up as the writer receives them, so the previews cost a
+downscale every second of scene time rather than another decode of the
+finished movie. Samples are kept per play, next to the partial movie
+cache, so a rebuild that reuses cached plays still has their frames. Each
+play also keeps its most drawn-on sample at ``THUMBNAIL_WIDTH`` as its
+thumbnail candidate.
+"""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, features
+
+SAMPLE_EVERY = 1.0  # seconds of scene time between samples
+PREVIEW_WIDTH = 320
+PREVIEW_FRAMES = 48
+PREVIEW_FPS = 4
+THUMBNAIL_WIDTH = 480
+# Channel difference from the background that counts as a drawn pixel.
+DRAWN_THRESHOLD = 16
+
+
+def _downscale(frame, width):
+    image = Image.fromarray(np.asarray(frame)[..., :3])
+    return image.resize((width, round(image.height * width / image.width)), Image.BOX)
+
+
+class PreviewSampler:
+    """Collects a small RGB frame every ``SAMPLE_EVERY`` seconds of each play.
+
+    Parameters
+    ----------
+    cache_dir
+        Where each play's samples are kept, as ``<play hash>.npy``, and its
+        thumbnail candidate, as ``<play hash>.thumbnail.npz``.
+    frame_rate
+        Scene frame rate, used to turn the sampling interval into frames.
+    """
+    def __init__(self, cache_dir, frame_rate):
+        self.cache_dir = Path(cache_dir)
+        self.every = max(1, round(SAMPLE_EVERY * frame_rate))
+        self.samples = {}
+        self.counts = {}
+        self.thumbnails = {}
+
+    def add(self, play, frame, num_frames=1):
+        """Sample ``frame`` if the play's sampling points fall in its ``num_frames``."""
+        start = self.counts.get(play, 0)
+        self.counts[play] = start + num_frames
+        hits = (start + num_frames - 1) // self.every - (start - 1) // self.every
+        if hits:
+            small = np.asarray(_downscale(frame, PREVIEW_WIDTH))
+            self.samples.setdefault(play, []).extend([small] * hits)
+            # Scored small like every other frame; later frames win ties.
+            score = drawn_fraction(small)
+            if score >= self.thumbnails.get(play, (-1.0, None))[0]:
+                self.thumbnails[play] = (score, np.asarray(_downscale(frame, THUMBNAIL_WIDTH)))
+
+    def save(self):
+        """Store the samples of every play rendered in this run."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for play, frames in self.samples.items():
+            np.save(self.cache_dir / f"{play}.npy", np.stack(frames))
+        for play, (score, frame) in self.thumbnails.items():
+            np.savez(self.cache_dir / f"{play}.thumbnail.npz", frame=frame, score=score)
+
+    def load(self, plays):
+        """Samples of ``plays`` in order; plays with none cached are skipped."""
+        frames = []
+        for play in plays:
+            if play in self.samples:
+                frames.extend(self.samples[play])
+            elif (self.cache_dir / f"{play}.npy").exists():
+                frames.extend(np.load(self.cache_dir / f"{play}.npy"))
+        return frames
+
+    def load_thumbnails(self, plays):
+        """``(score, frame)`` thumbnail candidates of ``plays`` in order."""
+        candidates = []
+        for play in plays:
+            path = self.cache_dir / f"{play}.thumbnail.npz"
+            if play in self.thumbnails:
+                candidates.append(self.thumbnails[play])
+            elif path.exists():
+                with np.load(path) as data:
+                    candidates.append((float(data["score"]), data["frame"]))
+        return candidates
+
+    def cache_files(self, play):
+        """``{name: path}`` of the files a play's previews are cached in."""
+        return {
+            f"{play}.preview.npy": self.cache_dir / f"{play}.npy",
+            f"{play}.thumbnail.npz": self.cache_dir / f"{play}.thumbnail.npz",
+        }
+
+    def prune(self, keep):
+        """Drop the samples of plays whose partial movie files are gone."""
+        for path in self.cache_dir.glob("*.np[yz]"):
+            if path.name.split(".")[0] not in keep:
+                path.unlink()
+
+
+def drawn_fraction(frame):
+    """Share of pixels that differ from the background, taken from the top-left corner."""
+    rgb = np.asarray(frame)[..., :3].astype(np.int16)
+    return float(np.any(np.abs(rgb - rgb[0, 0]) > DRAWN_THRESHOLD, axis=-1).mean())
+
+
+def pick_thumbnail(last_frame, candidates):
+    """The frame with the most drawn on it, preferring later frames on ties.
+
+    Lessons end by fading everything out, so the final frame alone would
+    make every thumbnail black. It still wins when nothing beats it. Frames
+    are scored at ``PREVIEW_WIDTH``, like the samples, and the winner comes
+    back ``THUMBNAIL_WIDTH`` wide whichever it is.
+    """
+    best = _downscale(last_frame, THUMBNAIL_WIDTH)
+    best_score = drawn_fraction(_downscale(last_frame, PREVIEW_WIDTH))
+    for score, frame in reversed(candidates):
+        if score > best_score:
+            best, best_score = Image.fromarray(frame), score
+    return best
+
+
+def write_previews(out_dir, scene_name, last_frame, samples, thumbnails=()):
+    """Write ``<Scene>.webp`` (and ``.avif``) thumbnails and ``<Scene>.preview.webp``.
+
+    The thumbnail is the most filled-in of the final frame and the plays'
+    ``thumbnails`` candidates (see :func:`pick_thumbnail`); the preview is up
+    to ``PREVIEW_FRAMES`` evenly spaced samples, looped at ``PREVIEW_FPS``.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    thumbnail = pick_thumbnail(last_frame, thumbnails)
+    thumbnail.save(out_dir / f"{scene_name}.webp", quality=80, method=6)
+    if features.check("avif"):
+        thumbnail.save(out_dir / f"{scene_name}.avif", quality=60)
+
+    if not samples:
+        return
+    picks = np.linspace(0, len(samples) - 1, min(len(samples), PREVIEW_FRAMES)).round().astype(int)
+    frames = [Image.fromarray(samples[i]) for i in picks]
+    frames[0].save(
+        out_dir / f"{scene_name}.preview.webp",
+        save_all=True,
+        append_images=frames[1:],
+        duration=round(1000 / PREVIEW_FPS),
+        loop=0,
+        quality=70,
+        method=4,
+    )
@@ -0,0 +1,226 @@
+"""Per-scene encoding profiles tuned for flat, screen-like lesson content.
+
+The combined scene movie is treated as the master. Candidate encodes are
+made from it, sampled frames are scored against it with SSIM, and the
+smallest candidate that stays above the quality target replaces it. The
+winning settings are recorded in the lesson's ``encoding.json`` so later
+builds re-encode with the same profile without searching again.
+
+Candidates keep a keyframe wherever the master has one. Every play starts
+its own partial movie with a keyframe, so those are the play boundaries and
+seeking to the start of a play, or of a chapter, stays cheap.
+
+The master is not lossless: it is the stream copy of the CRF 23 partial
+movie files, so every candidate is a second-generation encode and SSIM
+measures how far it drifts from the master, not from the rasterized
+frames. Artifacts already baked into the master go unscored, and a
+candidate can't look better than it. Scoring against the true frames
+would mean rendering every play losslessly first, which costs far more
+disk and time than a profile search is worth for these lessons.
+"""
+
+import json
+import shutil
+from dataclasses import asdict, dataclass
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import numpy as np
+from manim import logger
+
+PROFILES_FILE = "encoding.json"
+# Mean SSIM over mostly flat frames runs high, so the bar sits close to 1.
+QUALITY_TARGET = 0.995
+SAMPLE_FRAMES = 24
+# x264 tunes that suit flat fills, thin strokes and text.
+TUNES = ("animation", "stillimage")
+CRF_RANGE = (18, 36)
+
+
+@dataclass
+class Profile:
+    codec: str = "libx264"
+    crf: int = 23
+    tune: str = "animation"
+    preset: str = "slow"
+    keyint_seconds: int = 20
+
+    def options(self, fps):
+        options = {
+            "crf": str(self.crf),
+            "preset": self.preset,
+            # Keyframes come from the play boundaries, not a fixed cadence.
+            "g": str(int(self.keyint_seconds * fps)),
+            "sc_threshold": "0",
+        }
+        if self.tune:
+            options["tune"] = self.tune
+        return options
+
+
+def ssim(a, b):
+    """Mean SSIM of two luma planes, using 8x8 box windows."""
+    a = a.astype(np.float64)
+    b = b.astype(np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+
+    def box(x, size=8):
+        s = np.cumsum(np.cumsum(np.pad(x, ((1, 0), (1, 0))), axis=0), axis=1)
+        return (s[size:, size:] - s[:-size, size:] - s[size:, :-size] + s[:-size, :-size]) / size ** 2
+
+    mu_a, mu_b = box(a), box(b)
+    var_a = box(a * a) - mu_a ** 2
+    var_b = box(b * b) - mu_b ** 2
+    cov = box(a * b) - mu_a * mu_b
+    ssim_map = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / (
+        (mu_a ** 2 + mu_b ** 2 + c1) * (var_a + var_b + c2)
+    )
+    return float(ssim_map.mean())
+
+
+def _luma(frame):
+    return frame.to_ndarray(format="gray")
+
+
+def _video_stream(container, path):
+    if not container.streams.video:
+        raise ValueError(f"{path} has no video stream to profile")
+    return container.streams.video[0]
+
+
+def probe_master(path, samples=SAMPLE_FRAMES):
+    """Frame count, keyframe indices and evenly spaced sample frames of ``path``."""
+    keyframes = []
+    count = 0
+    with av.open(str(path)) as container:
+        stream = _video_stream(container, path)
+        for index, packet in enumerate(p for p in container.demux(stream) if p.dts is not None):
+            if packet.is_keyframe:
+                keyframes.append(index)
+            count = index + 1
+    if not count:
+        raise ValueError(f"{path} has no video frames to profile")
+    sample_indices = sorted(set(np.linspace(0, count - 1, samples).astype(int)))
+    return count, keyframes, sample_indices, read_frames(path, sample_indices)
+
+
+def read_frames(path, indices):
+    """Luma planes of the frames at ``indices`` (in display order)."""
+    wanted = set(indices)
+    frames = {}
+    with av.open(str(path)) as container:
+        for index, frame in enumerate(container.decode(_video_stream(container, path))):
+            if index in wanted:
+                frames[index] = _luma(frame)
+    missing = wanted - frames.keys()
+    if missing:
+        raise ValueError(f"{path} ends before frame {min(missing)} ({len(frames)} of {len(wanted)} frames read)")
+    return [frames[i] for i in indices]
+
+
+def encode(master, output, profile, keyframes):
+    """Re-encode ``master`` with ``profile``, forcing IDR frames at ``keyframes``."""
+    keyframes = set(keyframes)
+    # Index up front, like the combined movie, so browsers can seek right away.
+    faststart = {"movflags": "+faststart"}
+    with av.open(str(master)) as source, av.open(str(output), mode="w", options=faststart) as target:
+        source_stream = source.streams.video[0]
+        fps = Fraction(source_stream.average_rate)
+        options = profile.options(fps)
+        options["forced-idr"] = "1"
+        stream = target.add_stream(profile.codec, rate=fps, options=options)
+        stream.width = source_stream.codec_context.width
+        stream.height = source_stream.codec_context.height
+        stream.pix_fmt = "yuv420p"
+        target.metadata.update(source.metadata)
+        for index, frame in enumerate(source.decode(source_stream)):
+            frame.pts = index
+            frame.time_base = 1 / fps
+            frame.pict_type = (
+                av.video.frame.PictureType.I if index in keyframes else av.video.frame.PictureType.NONE
+            )
+            for packet in stream.encode(frame):
+                target.mux(packet)
+        for packet in stream.encode():
+            target.mux(packet)
+
+
+def score(candidate, sample_indices, reference):
+    """Worst SSIM of ``candidate`` over the sampled frames."""
+    frames = read_frames(candidate, sample_indices)
+    return min(ssim(a, b) for a, b in zip(frames, reference))
+
+
+def search(master, workdir, target=QUALITY_TARGET, tunes=TUNES):
+    """Find the smallest encode of ``master`` whose worst sampled SSIM meets ``target``.
+
+    Size falls and quality drops as CRF rises, so each tune is bisected for
+    its highest passing CRF; the smallest of those wins.
+    """
+    _, keyframes, sample_indices, reference = probe_master(master)
+    best = None
+    for tune in tunes:
+        low, high = CRF_RANGE
+        while low <= high:
+            crf = (low + high) // 2
+            profile = Profile(crf=crf, tune=tune)
+            candidate = Path(workdir) / f"{tune}_{crf}.mp4"
+            encode(master, candidate, profile, keyframes)
+            quality = score(candidate, sample_indices, reference)
+            size = candidate.stat().st_size
+            logger.info(
+                "Profile %(tune)s crf=%(crf)d: %(size)d bytes, SSIM %(q).4f",
+                {"tune": tune, "crf": crf, "size": size, "q": quality},
+            )
+            if quality >= target:
+                if best is None or size < best[2]:
+                    best = (profile, quality, size, candidate)
+                low = crf + 1
+            else:
+                high = crf - 1
+    return best
+
+
+def load_profiles(lesson_dir):
+    path = Path(lesson_dir) / PROFILES_FILE
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_profiles(lesson_dir, profiles):
+    path = Path(lesson_dir) / PROFILES_FILE
+    path.write_text(json.dumps(profiles, indent=2, sort_keys=True) + "\n")
+
+
+def tune_movie(movie, lesson_dir, scene_name, retune=False, target=QUALITY_TARGET):
+    """Replace ``movie`` with its profiled encode, searching only when needed."""
+    movie = Path(movie)
+    profiles = load_profiles(lesson_dir)
+    workdir = movie.parent / f".{movie.stem}_profiles"
+    workdir.mkdir(exist_ok=True)
+    try:
+        recorded = profiles.get(scene_name)
+        if recorded and not retune:
+            profile = Profile(**recorded["profile"])
+            output = workdir / "recorded.mp4"
+            _, keyframes, _, _ = probe_master(movie, samples=1)
+            encode(movie, output, profile, keyframes)
+        else:
+            before = movie.stat().st_size
+            best = search(movie, workdir, target)
+            if best is None:
+                logger.warning("No profile met SSIM %.3f for %s; keeping the master", target, scene_name)
+                return movie
+            profile, quality, size, output = best
+            profiles[scene_name] = {
+                "profile": asdict(profile),
+                "ssim": round(quality, 4),
+                "bytes": size,
+                "master_bytes": before,
+            }
+            save_profiles(lesson_dir, profiles)
+        shutil.move(str(output), str(movie))
+        logger.info("Encoded %s with %s", movie.name, profile)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return movie
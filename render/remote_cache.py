@@ -0,0 +1,272 @@
+"""Shared render cache over HTTP, with a small bundled server.
+
+Partial movie files and text SVGs are already named by content hash, so
+the same play or caption gets the same name on every machine. They are
+stored under path-independent keys:
+
+* ``partial/<hash>.json``: a play's manifest. It names the file that
+  holds the play and, for plays coalesced into a shared segment, the
+  play's frames within it.
+* ``partial/<hash>.mp4``: a standalone play's partial movie file.
+* ``partial/segment-<id>.mp4``: a shared segment, stored once for all
+  of its plays.
+* ``partial/<hash>.preview.npy``: the play's catalog preview samples.
+* ``partial/<hash>.thumbnail.npz``: the play's catalog thumbnail candidate.
+* ``texts/<hash>.svg``: a Text/MarkupText layout from ``media/texts``.
+
+Text SVGs are looked up one at a time: once a build uses the cache, a Text
+or MarkupText whose SVG is missing from ``text_dir`` asks the server for
+that one SVG before laying it out with Pango (see
+:func:`fetch_texts_on_miss`). SVGs laid out because neither cache had them
+are uploaded when the scene finishes.
+
+Every upload carries its SHA-256 in ``X-Content-SHA256``. The server
+refuses bodies that don't match it and keeps the digest beside the entry;
+downloads are checked against that recorded digest, so a truncated or
+corrupted entry is never used, and a download without a digest counts as
+a miss.
+
+Run a server for a team or CI job with::
+
+    python -m render.remote_cache --dir ~/.cache/lesson-renders --port 8766
+
+and point builds at it with ``RENDER_CACHE_URL=http://host:8766``, or
+``python -m render --cache http://host:8766``. When the server can't be
+reached, the build warns once and carries on with the local cache.
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from manim import MarkupText, Text, config, logger
+
+DIGEST_HEADER = "X-Content-SHA256"
+# One plain file name under a known prefix: no dot files, where the server
+# keeps digests, and no ``..``.
+KEY_PATTERN = re.compile(r"^(partial|texts)/[A-Za-z0-9_-][A-Za-z0-9_.-]*$")
+
+_active = None
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as fp:
+        fp.write(data)
+    os.replace(tmp, path)
+
+
+class RemoteCache:
+    """Client for a cache server at ``url``."""
+    timeout = 10
+
+    def __init__(self, url):
+        self.url = url.rstrip("/")
+        self.offline = False
+        self.laid_out = set()
+
+    def request(self, method, path, data=None, headers=None):
+        """Response body, or ``None`` for a miss or an unreachable server."""
+        if self.offline:
+            return None
+        req = urllib.request.Request(f"{self.url}/{path}", data=data, method=method, headers=headers or {})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                body = response.read()
+                expected = response.headers.get(DIGEST_HEADER)
+        except urllib.error.HTTPError as error:
+            if error.code != 404:
+                logger.warning("Render cache %s %s failed: %s", method, path, error)
+            return None
+        except (urllib.error.URLError, OSError) as error:
+            logger.warning("Render cache at %s unreachable (%s); using the local cache only", self.url, error)
+            self.offline = True
+            return None
+        if method == "GET" and (not expected or sha256(body) != expected):
+            logger.warning("Render cache entry %s failed its integrity check; ignoring it", path)
+            return None
+        return body
+
+    def get(self, key):
+        return self.request("GET", key)
+
+    def put(self, key, data):
+        return self.request("PUT", key, data, {DIGEST_HEADER: sha256(data)}) is not None
+
+    def keys(self, prefix):
+        listing = self.request("GET", f"{prefix}/")
+        return set(json.loads(listing)) if listing is not None else set()
+
+    def fetch(self, key, path):
+        """Download ``key`` to ``path``; returns whether it was there."""
+        data = self.get(key)
+        if data is None:
+            return False
+        _write_atomic(path, data)
+        return True
+
+    def push(self, key, path):
+        return self.put(key, Path(path).read_bytes())
+
+    def push_texts(self):
+        """Upload the text SVGs laid out here because neither cache had them."""
+        for path in sorted(self.laid_out):
+            if path.exists() and not self.offline:
+                self.push(f"texts/{path.name}", path)
+        self.laid_out.clear()
+
+
+def active():
+    """The cache client for this build, if any (``RENDER_CACHE_URL`` by default)."""
+    global _active
+    if _active is None and os.environ.get("RENDER_CACHE_URL"):
+        _active = RemoteCache(os.environ["RENDER_CACHE_URL"])
+    return _active
+
+
+def _fetch_on_miss(text2svg):
+    @functools.wraps(text2svg)
+    def lookup(self, color):
+        remote = active()
+        if remote is None:
+            return text2svg(self, color)
+        path = config.get_dir("text_dir") / f"{self._text2hash(color)}.svg"
+        if path.exists() or remote.fetch(f"texts/{path.name}", path):
+            return text2svg(self, color)
+        svg = text2svg(self, color)
+        remote.laid_out.add(path)
+        return svg
+
+    lookup.fetches_remote = True
+    return lookup
+
+
+def fetch_texts_on_miss():
+    """Have Text and MarkupText ask the active cache for an SVG ``text_dir`` lacks.
+
+    Safe to call more than once; without an active cache the lookup is
+    manim's own.
+    """
+    for text_class in (Text, MarkupText):
+        if not getattr(text_class._text2svg, "fetches_remote", False):
+            text_class._text2svg = _fetch_on_miss(text_class._text2svg)
+
+
+@contextmanager
+def use_remote_cache(url):
+    """Use the cache server at ``url`` (``None`` for the default) while active."""
+    global _active
+    previous = _active
+    if url:
+        _active = RemoteCache(url)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+# ═══════════════════════════════════════════════════════
+# Bundled server
+# ═══════════════════════════════════════════════════════
+
+def digest_path(path):
+    return path.with_name(f".{path.name}.sha256")
+
+
+def valid_key(key):
+    return bool(KEY_PATTERN.match(key)) and ".." not in key
+
+
+class CacheHandler(BaseHTTPRequestHandler):
+    def key_path(self, listing=False):
+        key = self.path.lstrip("/")
+        if listing and key.endswith("/") and key[:-1] in ("partial", "texts"):
+            return key, self.server.root / key
+        path = (self.server.root / key).resolve()
+        if not valid_key(key) or not path.is_relative_to(self.server.root):
+            self.send_error(400, "bad cache key")
+            return key, None
+        return key, path
+
+    def do_GET(self):
+        key, path = self.key_path(listing=True)
+        if path is None:
+            return
+        if key.endswith("/"):
+            names = sorted(p.name for p in path.glob("*") if not p.name.startswith(".")) if path.exists() else []
+            body = json.dumps(names).encode()
+            digest = sha256(body)
+        elif path.is_file() and digest_path(path).is_file():
+            body = path.read_bytes()
+            # The digest recorded at upload, so damage on disk shows up too.
+            digest = digest_path(path).read_text()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header(DIGEST_HEADER, digest)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):
+        key, path = self.key_path()
+        if path is None:
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if sha256(body) != self.headers.get(DIGEST_HEADER):
+            self.send_error(422, "body does not match its digest")
+            return
+        _write_atomic(digest_path(path), sha256(body).encode())
+        _write_atomic(path, body)
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        logger.debug("cache %s", format % args)
+
+
+class CacheServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, root):
+        super().__init__(address, CacheHandler)
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.root = self.root.resolve()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m render.remote_cache", description="Serve a shared render cache.")
+    parser.add_argument("--dir", default=Path.home() / ".cache" / "lesson-renders", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args(argv)
+    server = CacheServer((args.host, args.port), args.dir)
+    print(f"Render cache on http://{args.host}:{args.port}, storing in {args.dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Cairo renderer tuned for the lesson build."""
+
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from .tiles import TiledCamera, tiled
+from .writer import LessonFileWriter
+
+
+class LessonRenderer(CairoRenderer):
+    """Hands the camera's pixel array to the file writer without copying it first.
+
+    The stock renderer copies every frame with ``np.array`` before queueing it.
+    :class:`LessonFileWriter` copies into its frame ring before returning, so
+    each animation frame is still copied exactly once, into a reused slot
+    instead of a new allocation.
+    ``get_frame`` still returns a copy for callers that keep the result, such
+    as the static background cache.
+
+    Frames are drawn by :class:`TiledCamera`, which rasterizes 1080p and
+    larger frames in parallel bands. Unless a ``camera_class`` is given,
+    each scene keeps its own camera (``MovingCameraScene``'s, say), drawn in
+    bands when it can be (see :func:`~.tiles.tiled`).
+    """
+    def __init__(self, file_writer_class=LessonFileWriter, camera_class=None, **kwargs):
+        self.scene_camera = camera_class is None
+        super().__init__(file_writer_class=file_writer_class, camera_class=camera_class or TiledCamera, **kwargs)
+
+    def init_scene(self, scene):
+        # The renderer is made before the scene, so its camera class is only known now.
+        camera_class = tiled(scene.camera_class)
+        if self.scene_camera and type(self.camera) is not camera_class:
+            self.camera = camera_class()
+        super().init_scene(scene)
+        # The writer needs each play's duration to decide what to coalesce.
+        self.file_writer.scene = scene
+
+    def render(self, scene, time, moving_mobjects=None):
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
+
+
+class SnapshotRenderer(CairoRenderer):
+    """Skips every play to its end and keeps the frame it ends on.
+
+    Nothing is encoded: each play jumps straight to its final state, the
+    scene is drawn once, and ``snapshots`` collects ``(time, frame)`` pairs.
+    That is all a golden-frame check needs, at a fraction of a full render.
+    A scene without plays gets one snapshot of how it finishes.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.snapshots = []
+        self.clock = 0.0
+
+    def snapshot(self, scene):
+        # The static image of a frozen wait already has the mobjects on it;
+        # drawing them over it again would double translucent fills.
+        self.static_image = None
+        self.update_frame(scene)
+        self.snapshots.append((self.clock, self.get_frame()))
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.clock += scene.duration
+        self.snapshot(scene)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if not self.num_plays:
+            self.snapshot(scene)
+
+
+class LayoutRenderer(CairoRenderer):
+    """Runs a scene's timeline without drawing anything.
+
+    Every play skips straight to its end and ``inspect(scene, time)`` is
+    called on the state it leaves behind; scenes without plays are
+    inspected once when they finish. Frame drawing is stubbed out, so only
+    the scene's own construction (text layout included) costs anything.
+    """
+    def __init__(self, inspect, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.inspect = inspect
+
+    def play(self, scene, *args, **kwargs):
+        super().play(scene, *args, **kwargs)
+        self.inspect(scene, self.time)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if not self.num_plays:
+            self.inspect(scene, self.time)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        return None
+
+    def freeze_current_frame(self, duration):
+        pass
@@ -0,0 +1,117 @@
+"""Bounded ring of preallocated frame buffers shared by rasterizer and encoder."""
+
+import mmap
+import threading
+import time
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+
+import numpy as np
+
+
+@dataclass
+class RingMetrics:
+    """Counters describing how well the two pipeline stages overlap."""
+    frames: int = 0
+    max_depth: int = 0
+    producer_stalls: int = 0
+    producer_stall_time: float = 0.0
+    encoder_idle_time: float = 0.0
+
+    def summary(self):
+        return (
+            f"{self.frames} frames, max queue depth {self.max_depth}, "
+            f"{self.producer_stalls} stalls ({self.producer_stall_time:.2f}s waiting on encoder), "
+            f"encoder idle {self.encoder_idle_time:.2f}s"
+        )
+
+
+class FrameRing:
+    """Fixed number of frame slots living in one anonymous memory map.
+
+    This is a bounded copy ring, not a zero-copy handoff: the camera draws
+    the next frame into the same pixel array, so :meth:`push` copies each
+    finished frame into a free slot before publishing it. That one copy
+    replaces the ``np.array`` copy stock manim makes per frame, but lands in
+    memory that is reused instead of freshly allocated. The encoder reads
+    the slot in place and hands it back. When every slot is in flight the
+    rasterizer blocks, so memory use never grows past ``slots`` frames.
+
+    If the encoder fails it hands its exception to :meth:`fail`, and the
+    next :meth:`push` or :meth:`close` raises it instead of waiting forever
+    for a slot the encoder will never return.
+    """
+    # Seconds between checks for an encoder failure while blocked.
+    poll_interval = 0.1
+
+    def __init__(self, shape, slots=8, dtype=np.uint8):
+        self.shape = tuple(shape)
+        frame_bytes = int(np.prod(self.shape)) * np.dtype(dtype).itemsize
+        self._buffer = mmap.mmap(-1, frame_bytes * slots)
+        self.frames = np.frombuffer(self._buffer, dtype=dtype).reshape((slots, *self.shape))
+        self.slots = slots
+        self.metrics = RingMetrics()
+
+        self._free = Queue(maxsize=slots)
+        self._filled = Queue(maxsize=slots + 1)
+        for index in range(slots):
+            self._free.put(index)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.error = None
+
+    def fail(self, error):
+        """Record the consumer's exception; the producer raises it next."""
+        self.error = error
+
+    def raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def _wait(self, action):
+        while True:
+            self.raise_error()
+            try:
+                return action(timeout=self.poll_interval)
+            except (Empty, Full):
+                pass
+
+    def push(self, frame, num_frames=1, keyframe=False):
+        """Copy ``frame`` into the next free slot, waiting if the encoder is behind."""
+        if self._free.empty():
+            start = time.perf_counter()
+            index = self._wait(self._free.get)
+            self.metrics.producer_stalls += 1
+            self.metrics.producer_stall_time += time.perf_counter() - start
+        else:
+            index = self._wait(self._free.get)
+
+        np.copyto(self.frames[index], frame)
+        with self._lock:
+            self._in_flight += 1
+            self.metrics.max_depth = max(self.metrics.max_depth, self._in_flight)
+        self.metrics.frames += num_frames
+        self._wait(lambda timeout: self._filled.put((index, num_frames, keyframe), timeout=timeout))
+
+    def close(self):
+        """Tell the consumer that no more frames are coming."""
+        self._wait(lambda timeout: self._filled.put((None, 0, False), timeout=timeout))
+
+    def drain(self):
+        """Yield ``(frame, num_frames, keyframe)`` until :meth:`close` is called.
+
+        The yielded array is a view into the ring; the slot is recycled as soon
+        as the consumer asks for the next frame, so it must not be kept.
+        """
+        while True:
+            start = time.perf_counter()
+            index, num_frames, keyframe = self._filled.get()
+            self.metrics.encoder_idle_time += time.perf_counter() - start
+            if index is None:
+                return
+            try:
+                yield self.frames[index], num_frames, keyframe
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                self._free.put(index)
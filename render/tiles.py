@@ -0,0 +1,146 @@
+"""Camera that rasterizes each frame in horizontal bands on a thread pool."""
+
+import functools
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import cairo
+import numpy as np
+from manim.camera.camera import Camera
+
+# Kept off the camera: manim hashes every play from ``camera.__dict__``, and
+# thread pools and cairo contexts would make those hashes differ run to run.
+# camera -> (pixel_array, [(first_row, end_row, context)])
+_band_contexts = weakref.WeakKeyDictionary()
+
+# Camera methods a subclass must leave alone for the bands to see the same
+# points, and draw them the same way, as the stock path.
+_DRAWING_METHODS = (
+    "transform_points_pre_display",
+    "display_vectorized",
+    "display_multiple_non_background_colored_vmobjects",
+)
+
+
+@functools.cache
+def band_pool(workers):
+    """Thread pool shared by every camera drawing ``workers`` bands."""
+    return ThreadPoolExecutor(workers, thread_name_prefix="band")
+
+
+class TiledCamera(Camera):
+    """Splits large frames into ``bands`` horizontal tiles drawn in parallel.
+
+    Each band is a cairo surface over its own rows of the camera's pixel
+    array, so the tiles write straight into the shared frame and nothing has
+    to be stitched afterwards. Every band only draws the VMobjects whose
+    bounding box reaches its rows, in the usual order. pycairo releases the
+    GIL while cairo fills and strokes, so the bands rasterize on separate
+    cores from one thread pool.
+
+    Frames smaller than ``min_pixels`` are drawn the stock way; below about
+    1080p the fan-out costs more than it saves. Mobjects with a background
+    image also use the stock path.
+    """
+    bands = os.cpu_count() or 1
+    min_pixels = 1920 * 1080
+    # Cairo's default miter limit: a sharp join can reach this many half-widths.
+    miter_limit = 10
+
+    def get_band_contexts(self):
+        """``(first_row, end_row, context)`` for each band of ``pixel_array``.
+
+        The contexts are kept for as long as the pixel array is, but their
+        matrices are set on every call: a ``MovingCamera`` frame moves.
+        """
+        pw, ph = self.pixel_width, self.pixel_height
+        array, contexts = _band_contexts.get(self, (None, None))
+        if array is not self.pixel_array:
+            edges = np.linspace(0, ph, min(self.bands, ph) + 1).round().astype(int)
+            contexts = []
+            for top, bottom in zip(edges[:-1], edges[1:]):
+                surface = cairo.ImageSurface.create_for_data(
+                    self.pixel_array[top:bottom].data, cairo.FORMAT_ARGB32, pw, bottom - top,
+                )
+                contexts.append((top, bottom, cairo.Context(surface)))
+            _band_contexts[self] = (self.pixel_array, contexts)
+        fw, fh = self.frame_width, self.frame_height
+        fc = self.frame_center
+        for top, _, ctx in contexts:
+            # The full-frame matrix, moved up so the band's first row is y = 0.
+            ctx.set_matrix(
+                cairo.Matrix(
+                    (pw / fw),
+                    0,
+                    0,
+                    -(ph / fh),
+                    (pw / 2) - fc[0] * (pw / fw),
+                    (ph / 2) + fc[1] * (ph / fh) - top,
+                ),
+            )
+        return contexts
+
+    def row_extents(self, vmobjects):
+        """Pixel rows each VMobject can touch, including its widest stroke."""
+        ph, fh = self.pixel_height, self.frame_height
+        extents = np.empty((len(vmobjects), 2))
+        for i, vmobject in enumerate(vmobjects):
+            points = vmobject.points
+            if len(points) == 0:
+                extents[i] = (np.inf, -np.inf)
+                continue
+            if not np.all(np.isfinite(points)):
+                extents[i] = (-np.inf, np.inf)
+                continue
+            # Bezier curves stay inside their control points' hull.
+            low, high = points[:, 1].min(), points[:, 1].max()
+            stroke = max(
+                np.max(vmobject.get_stroke_width()),
+                np.max(vmobject.get_stroke_width(background=True)),
+            )
+            margin = stroke * self.cairo_line_width_multiple * ph / fh * self.miter_limit / 2 + 2
+            center = ph / 2 + self.frame_center[1] * ph / fh
+            extents[i] = (center - high * ph / fh - margin, center - low * ph / fh + margin)
+        return extents
+
+    def draw_band(self, ctx, vmobjects):
+        for vmobject in vmobjects:
+            self.display_vectorized(vmobject, ctx)
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        vmobjects = list(vmobjects)
+        if (
+            self.bands < 2
+            or len(vmobjects) < 2
+            or pixel_array is not self.pixel_array
+            or self.pixel_width * self.pixel_height < self.min_pixels
+        ):
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+
+        pool = band_pool(self.bands)
+        extents = self.row_extents(vmobjects)
+        jobs = []
+        for top, bottom, ctx in self.get_band_contexts():
+            visible = (extents[:, 1] >= top) & (extents[:, 0] < bottom)
+            if visible.any():
+                batch = [vmobject for vmobject, keep in zip(vmobjects, visible) if keep]
+                jobs.append(pool.submit(self.draw_band, ctx, batch))
+        for job in jobs:
+            job.result()
+
+
+@functools.cache
+def tiled(camera_class):
+    """``camera_class`` drawing in bands, or ``camera_class`` itself if it draws its own way.
+
+    ``MovingCamera`` and the cameras built on it tile; ``ThreeDCamera``
+    projects points before drawing them, so it keeps the stock path.
+    """
+    if camera_class is Camera:
+        return TiledCamera
+    if issubclass(camera_class, TiledCamera):
+        return camera_class
+    if any(getattr(camera_class, name) is not getattr(Camera, name) for name in _DRAWING_METHODS):
+        return camera_class
+    return type(f"Tiled{camera_class.__name__}", (TiledCamera, camera_class), {"__module__": __name__})
@@ -0,0 +1,495 @@
+"""Scene file writer that overlaps rasterization with encoding."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from threading import Thread
+
+import av
+import numpy as np
+from manim import __version__, config, logger
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import is_gif_format, write_to_movie
+
+from . import remote_cache
+from .chapters import AUTOCREATED, index_chapters, movie_frames
+from .previews import PreviewSampler, write_previews
+from .ring import FrameRing
+
+
+def _copy_frame(frame):
+    """A new frame with the same pixels, without converting them again."""
+    copy = av.VideoFrame(frame.width, frame.height, frame.format.name)
+    for source, target in zip(frame.planes, copy.planes):
+        target.update(source)
+    return copy
+
+
+class SegmentIndex:
+    """Where each coalesced play sits in its shared segment, one small file per play.
+
+    Entries live in ``<directory>/<play hash>.json`` and are read from disk
+    on every lookup. Each is replaced atomically on its own, so renders of
+    the same scene running at once (daemon workers, variants, parallel
+    builds) never drop each other's entries the way rewriting one shared
+    index would.
+    """
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def path(self, stem):
+        return self.directory / f"{stem}.json"
+
+    def get(self, stem, default=None):
+        try:
+            return json.loads(self.path(stem).read_text())
+        except FileNotFoundError:
+            return default
+
+    def __contains__(self, stem):
+        return self.path(stem).exists()
+
+    def __setitem__(self, stem, entry):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{stem}.")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(entry, fp, sort_keys=True)
+        os.replace(tmp, self.path(stem))
+
+    def pop(self, stem, default=None):
+        entry = self.get(stem, default)
+        self.path(stem).unlink(missing_ok=True)
+        return entry
+
+    def prune(self, partial_movie_directory, extension):
+        """Drop the entries of plays whose partial movie files are gone.
+
+        Each file is checked right before its entry goes, and entries are
+        only written once their file exists, so a concurrent render's new
+        entries survive.
+        """
+        for path in self.directory.glob("*.json"):
+            if not (Path(partial_movie_directory) / f"{path.stem}{extension}").exists():
+                path.unlink(missing_ok=True)
+
+    def import_legacy(self, path):
+        """Move entries from a single ``<Scene>.segments.json`` written by older builds."""
+        path = Path(path)
+        if path.exists():
+            for stem, entry in json.loads(path.read_text()).items():
+                if stem not in self:
+                    self[stem] = entry
+            path.unlink(missing_ok=True)
+
+
+class LessonFileWriter(SceneFileWriter):
+    """Writes partial movie files through a bounded :class:`FrameRing`.
+
+    Stock manim hands every frame to its encoder thread through an unbounded
+    queue, so a fast rasterizer just piles up full-size copies in memory. Here
+    the rasterizer copies into one of ``ring_slots`` preallocated buffers and
+    blocks when all of them are waiting to be encoded, so the build runs at
+    the pace of the slower stage without the memory growing.
+
+    Runs of consecutive plays no longer than ``coalesce_under`` seconds share
+    one encoder session. Each play starts on an IDR frame and keeps its own
+    cache entry: ``<hash>.mp4`` is a hard link to the shared segment, and
+    ``partial_movie_files/<Scene>.segments/<hash>.json`` records which frames
+    of it belong to the play (see :class:`SegmentIndex`). The index sits
+    outside the scene's cache folder so manim's cache cleanup never deletes
+    it. When the movie is combined, the concat list cuts plays out of their
+    segments at those keyframes, so the final file is still a plain stream
+    copy, written with its index at the front so players can seek in it
+    before it has downloaded.
+
+    Sections marked with ``self.next_section(name)`` become the movie's
+    chapters (see :mod:`render.chapters`).
+
+    Each play is also sampled once a second for the catalog previews (see
+    :mod:`render.previews`); they are written when the movie is finished.
+
+    With a shared render cache configured (see :mod:`render.remote_cache`),
+    plays missing locally are looked up there before they are rendered, and
+    plays rendered here are uploaded when the scene is finished.
+    """
+    ring_slots = 8
+    coalesce_under = 1.0
+    max_segment_plays = 24
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.scene = None
+        self.ring = None
+        self.segment = None
+        self.segment_index = None
+        self.scene_name = scene_name
+        self.previews = None
+        self.remote = remote_cache.active()
+        self.rendered = []
+        self.fetched = {}
+        if hasattr(self, "partial_movie_directory"):
+            self.previews = PreviewSampler(
+                self.partial_movie_directory.parent / f"{scene_name}.previews", config.frame_rate,
+            )
+            self.segment_index = SegmentIndex(self.partial_movie_directory.parent / f"{scene_name}.segments")
+            self.segment_index.import_legacy(self.partial_movie_directory.parent / f"{scene_name}.segments.json")
+            if self.remote is not None and write_to_movie():
+                remote_cache.fetch_texts_on_miss()
+
+    # ───────────────────────────────────────────────────────
+    # Encoder sessions
+    # ───────────────────────────────────────────────────────
+
+    def partial_movie_options(self):
+        """Codec, pixel format and encoder options for a partial movie file."""
+        codec = "libx264"
+        pix_fmt = "yuv420p"
+        options = {
+            "an": "1",  # ffmpeg: -an, no audio
+            "crf": "23",  # ffmpeg: -crf, constant rate factor (improved bitrate)
+        }
+        if config.movie_file_extension == ".webm":
+            codec = "libvpx-vp9"
+            options["-auto-alt-ref"] = "1"
+            if config.transparent:
+                pix_fmt = "yuva420p"
+        elif config.transparent:
+            codec = "qtrle"
+            pix_fmt = "argb"
+
+        if codec == "libx264":
+            # Plays are cut back out of segments by stream copy, which only
+            # works at IDR frames with nothing reordered across them. Standalone
+            # partials get the same settings: the movie is one stream copy of
+            # both kinds, so they must share their H.264 parameter sets.
+            options["forced-idr"] = "1"
+            options["bf"] = "0"
+        return codec, pix_fmt, options
+
+    def open_partial_movie_stream(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        codec, pix_fmt, options = self.partial_movie_options()
+        self.video_container = av.open(str(file_path), mode="w")
+        self.video_stream = self.video_container.add_stream(
+            codec, rate=to_av_frame_rate(config.frame_rate), options=options,
+        )
+        self.video_stream.pix_fmt = pix_fmt
+        self.video_stream.width = config.pixel_width
+        self.video_stream.height = config.pixel_height
+
+        if self.ring is None:
+            shape = (config.pixel_height, config.pixel_width, 4)
+            self.ring = FrameRing(shape, slots=self.ring_slots)
+        self.writer_thread = Thread(target=self.listen_and_write, daemon=True)
+        self.writer_thread.start()
+
+    def listen_and_write(self):
+        try:
+            for frame, num_frames, keyframe in self.ring.drain():
+                self.encode_and_write_frame(frame, num_frames, keyframe)
+        except Exception as error:
+            # Hand it to the rasterizer, which would otherwise wait for free slots forever.
+            self.ring.fail(error)
+
+    def encode_and_write_frame(self, frame, num_frames, keyframe=False):
+        # One colour conversion per ring slot. Encoders may hold on to the
+        # frames they are given, so each held frame is a fresh copy of it.
+        converted = av.VideoFrame.from_ndarray(frame, format="rgba")
+        converted = converted.reformat(format=self.video_stream.pix_fmt)
+        for index in range(num_frames):
+            av_frame = converted if index == 0 else _copy_frame(converted)
+            if keyframe:
+                av_frame.pict_type = av.video.frame.PictureType.I
+                keyframe = False
+            else:
+                av_frame.pict_type = av.video.frame.PictureType.NONE
+            for packet in self.video_stream.encode(av_frame):
+                self.video_container.mux(packet)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if write_to_movie() and isinstance(frame_or_renderer, np.ndarray):
+            keyframe = False
+            play_file = self.partial_movie_file_path
+            if self.segment is not None:
+                play_file, start = self.segment["plays"][-1]
+                keyframe = self.segment["frames"] == start
+                self.segment["frames"] += num_frames
+            self.previews.add(Path(play_file).stem, frame_or_renderer, num_frames)
+            self.ring.push(frame_or_renderer, num_frames, keyframe)
+        else:
+            super().write_frame(frame_or_renderer, num_frames)
+
+    def close_partial_movie_stream(self):
+        try:
+            self.ring.close()
+        finally:
+            self.writer_thread.join()
+        self.ring.raise_error()
+
+        for packet in self.video_stream.encode():
+            self.video_container.mux(packet)
+        self.video_container.close()
+
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+        logger.debug("Frame ring: %s", self.ring.metrics.summary())
+
+    # ───────────────────────────────────────────────────────
+    # Coalescing short plays
+    # ───────────────────────────────────────────────────────
+
+    def is_short_play(self):
+        # Segments rely on libx264 keyframe control, so only plain mp4 output.
+        return (
+            self.scene is not None
+            and config.movie_file_extension == ".mp4"
+            and not config.transparent
+            and not is_gif_format()
+            and self.scene.duration <= self.coalesce_under
+        )
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if not (write_to_movie() and allow_write):
+            self.close_segment()
+            return
+        if not self.is_short_play():
+            self.close_segment()
+            self.open_partial_movie_stream(file_path=file_path)
+            self.rendered.append(Path(self.partial_movie_file_path))
+            # A stale entry would make combine cut this standalone file.
+            self.segment_index.pop(Path(self.partial_movie_file_path).stem)
+            return
+
+        if self.segment is not None and len(self.segment["plays"]) >= self.max_segment_plays:
+            self.close_segment()
+        if self.segment is None:
+            pending = self.partial_movie_directory / f"segment_{os.getpid()}_pending{config.movie_file_extension}"
+            self.open_partial_movie_stream(file_path=pending)
+            self.segment = {"path": pending, "plays": [], "frames": 0}
+        play_file = Path(file_path or self.partial_movie_files[self.renderer.num_plays])
+        self.segment["plays"].append((play_file, self.segment["frames"]))
+        self.rendered.append(play_file)
+
+    def end_animation(self, allow_write=False):
+        if self.segment is None and write_to_movie() and allow_write:
+            self.close_partial_movie_stream()
+
+    def close_segment(self):
+        """Finish the shared encoder session and give each play its cache entry."""
+        if self.segment is None:
+            return
+        segment, self.segment = self.segment, None
+        self.close_partial_movie_stream()
+
+        play_files = [play_file for play_file, _ in segment["plays"]]
+        segment_id = hashlib.sha256(
+            "".join(play_file.stem for play_file in play_files).encode()
+        ).hexdigest()[:16]
+        starts = [start for _, start in segment["plays"]] + [segment["frames"]]
+        for (play_file, start), end in zip(segment["plays"], starts[1:]):
+            play_file.unlink(missing_ok=True)
+            os.link(segment["path"], play_file)
+            self.segment_index[play_file.stem] = {
+                "segment": segment_id,
+                "start": start,
+                "frames": end - start,
+            }
+        segment["path"].unlink()
+        logger.info(
+            "Coalesced %(n)d plays into one segment (%(frames)d frames)",
+            {"n": len(play_files), "frames": segment["frames"]},
+        )
+
+    def concat_entries(self, input_files):
+        """Concat-demuxer entries, cutting coalesced plays out of their segments.
+
+        Neighbouring plays that sit back to back in the same segment collapse
+        into a single entry.
+        """
+        fps = config.frame_rate
+        entries = []
+        for pf_path in input_files:
+            info = self.segment_index.get(Path(pf_path).stem)
+            if info is None:
+                entries.append([pf_path, None, None, None])
+                continue
+            start, end = info["start"], info["start"] + info["frames"]
+            last = entries[-1] if entries else None
+            if last and last[1] == info["segment"] and last[3] == start:
+                last[3] = end
+            else:
+                entries.append([pf_path, info["segment"], start, end])
+
+        lines = []
+        for pf_path, segment_id, start, end in entries:
+            lines.append(f"file 'file:{Path(pf_path).as_posix()}'")
+            if segment_id is not None:
+                lines.append(f"inpoint {start / fps:.6f}")
+                lines.append(f"outpoint {end / fps:.6f}")
+        return lines
+
+    def combine_files(self, input_files, output_file, create_gif=False, includes_sound=False):
+        if create_gif:
+            if not any(Path(pf_path).stem in self.segment_index for pf_path in input_files):
+                return super().combine_files(input_files, output_file, create_gif, includes_sound)
+            # A cached coalesced play is a link to its whole segment, and the
+            # stock GIF path would take all of it; cut the plays out first.
+            cut = self.partial_movie_directory / f"{self.scene_name}_cut{config.movie_file_extension}"
+            self.combine_files(input_files, cut, includes_sound=includes_sound)
+            try:
+                return super().combine_files([cut], output_file, create_gif, includes_sound)
+            finally:
+                cut.unlink(missing_ok=True)
+
+        file_list = self.partial_movie_directory / "partial_movie_file_list.txt"
+        with file_list.open("w", encoding="utf-8") as fp:
+            fp.write("# This file is used internally by FFMPEG.\n")
+            fp.write("\n".join(self.concat_entries(input_files)) + "\n")
+
+        av_options = {"safe": "0"}
+        if not includes_sound:
+            av_options["an"] = "1"
+
+        partial_movies_input = av.open(str(file_list), options=av_options, format="concat")
+        partial_movies_stream = partial_movies_input.streams.video[0]
+        output_options = {}
+        if Path(output_file).suffix in (".mp4", ".mov"):
+            # moov before mdat, so a browser can seek with range requests straight away.
+            output_options["movflags"] = "+faststart"
+        output_container = av.open(str(output_file), mode="w", options=output_options)
+        output_container.metadata["comment"] = f"Rendered with Manim Community v{__version__}"
+        output_stream = output_container.add_stream_from_template(template=partial_movies_stream)
+        if config.transparent and config.movie_file_extension == ".webm":
+            output_stream.pix_fmt = "yuva420p"
+        for packet in partial_movies_input.demux(partial_movies_stream):
+            # Skip the flushing packets that demux generates.
+            if packet.dts is None:
+                continue
+            packet.dts = None
+            packet.stream = output_stream
+            output_container.mux(packet)
+
+        partial_movies_input.close()
+        output_container.close()
+
+    def finish(self):
+        self.close_segment()
+        # Counted before manim's cache cleanup can remove any partial files.
+        chapters = self.section_chapters() if write_to_movie() and not is_gif_format() else []
+        super().finish()
+        if self.ring is not None:
+            logger.info("Frame ring totals: %s", self.ring.metrics.summary())
+        if chapters:
+            index_chapters(self.movie_file_path, chapters)
+        if write_to_movie() and self.segment_index is not None:
+            self.segment_index.prune(self.partial_movie_directory, config.movie_file_extension)
+        if write_to_movie() and self.previews is not None:
+            self.write_previews()
+        if write_to_movie() and self.remote is not None:
+            self.push_to_remote()
+
+    def section_chapters(self):
+        """``[(name, first_frame)]`` for each marked section that made it into the movie."""
+        chapters = []
+        frames = 0
+        for section in self.sections:
+            play_files = section.get_clean_partial_movie_files()
+            if play_files and section.name != AUTOCREATED:
+                chapters.append((section.name, frames))
+            for path in play_files:
+                entry = self.segment_index.get(Path(path).stem)
+                frames += entry["frames"] if entry else movie_frames(path)
+        return chapters
+
+    def write_previews(self):
+        """Thumbnail and animated preview for the catalog, from this run's samples."""
+        plays = [Path(path).stem for path in self.partial_movie_files if path is not None]
+        self.previews.save()
+        # Cached plays were never drawn, so draw the final state once. A frozen
+        # wait's static image already holds the mobjects; don't draw them twice.
+        self.renderer.static_image = None
+        self.renderer.update_frame(self.scene)
+        write_previews(
+            Path(config.media_dir) / "previews",
+            # Pacing variants get their own previews under their movie's name.
+            Path(self.movie_file_path).stem,
+            self.renderer.camera.pixel_array,
+            self.previews.load(plays),
+            self.previews.load_thumbnails(plays),
+        )
+        self.previews.prune({
+            path.stem for path in self.partial_movie_directory.glob(f"*{config.movie_file_extension}")
+        })
+
+    # ───────────────────────────────────────────────────────
+    # Shared render cache
+    # ───────────────────────────────────────────────────────
+
+    def remote_file_key(self, stem):
+        # Coalesced plays share their segment's bytes, so store those once.
+        entry = self.segment_index.get(stem)
+        name = f"segment-{entry['segment']}" if entry else stem
+        return f"partial/{name}{config.movie_file_extension}"
+
+    def is_already_cached(self, hash_invocation):
+        if super().is_already_cached(hash_invocation):
+            return True
+        if self.remote is None or not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        return self.fetch_play(hash_invocation)
+
+    def fetch_play(self, stem):
+        """Bring one play in from the shared cache; returns whether it was there."""
+        manifest = self.remote.get(f"partial/{stem}.json")
+        if manifest is None:
+            return False
+        manifest = json.loads(manifest)
+        play_file = self.partial_movie_directory / f"{stem}{config.movie_file_extension}"
+        file_key = manifest["file"]
+        if file_key in self.fetched:
+            play_file.unlink(missing_ok=True)
+            os.link(self.fetched[file_key], play_file)
+        elif self.remote.fetch(file_key, play_file):
+            self.fetched[file_key] = play_file
+        else:
+            return False
+
+        if manifest.get("segment"):
+            self.segment_index[stem] = manifest["segment"]
+        else:
+            self.segment_index.pop(stem)
+        if self.previews is not None:
+            for name, path in self.previews.cache_files(stem).items():
+                self.remote.fetch(f"partial/{name}", path)
+        return True
+
+    def push_to_remote(self):
+        """Upload the plays rendered in this run, then the text SVGs laid out for it."""
+        pushed = set()
+        uploaded = 0
+        for play_file in self.rendered:
+            if not play_file.exists() or self.remote.offline:
+                continue
+            stem = play_file.stem
+            file_key = self.remote_file_key(stem)
+            if file_key not in pushed and self.remote.push(file_key, play_file):
+                pushed.add(file_key)
+            if file_key not in pushed:
+                continue
+            if self.previews is not None:
+                for name, path in self.previews.cache_files(stem).items():
+                    if path.exists():
+                        self.remote.push(f"partial/{name}", path)
+            # The manifest goes last, so readers never see a play without its file.
+            manifest = {"file": file_key, "segment": self.segment_index.get(stem)}
+            uploaded += self.remote.put(f"partial/{stem}.json", json.dumps(manifest).encode())
+        self.remote.push_texts()
+        if uploaded:
+            logger.info("Uploaded %(n)d plays to the render cache", {"n": uploaded})
@@ -0,0 +1,67 @@
+import json
+from fractions import Fraction
+from types import SimpleNamespace
+
+import av
+import numpy as np
+import pytest
+
+from render.chapters import chapters_path, index_chapters, reindex_chapters
+from render.writer import LessonFileWriter, SegmentIndex
+
+
+def write_movie(path, frames, keyframes=()):
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=30, options={"forced-idr": "1", "g": "300"})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        container.start_encoding()
+        for index in range(frames):
+            pixels = np.full((48, 64, 3), (index * 7) % 256, dtype=np.uint8)
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+            frame.pts, frame.time_base = index, Fraction(1, 30)
+            frame.pict_type = (
+                av.video.frame.PictureType.I if index in keyframes else av.video.frame.PictureType.NONE
+            )
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return path
+
+
+def section(name, *files):
+    return SimpleNamespace(name=name, get_clean_partial_movie_files=lambda: list(files))
+
+
+def test_section_chapters_count_frames_of_files_and_segments(tmp_path):
+    index = SegmentIndex(tmp_path / "Scene.segments")
+    index["coalesced"] = {"segment": "s1", "start": 0, "frames": 5}
+    opening = write_movie(tmp_path / "opening.mp4", 4, keyframes={0})
+    first = write_movie(tmp_path / "first.mp4", 10, keyframes={0})
+    last = write_movie(tmp_path / "last.mp4", 7, keyframes={0})
+    writer = SimpleNamespace(segment_index=index, sections=[
+        section("autocreated", str(opening)),
+        section("Introduction", str(first), str(tmp_path / "coalesced.mp4")),
+        section("Skipped plays only"),
+        section("Conclusion", str(last)),
+    ])
+    assert LessonFileWriter.section_chapters(writer) == [("Introduction", 4), ("Conclusion", 19)]
+
+
+def test_index_chapters_records_keyframe_times_and_offsets(tmp_path):
+    movie = write_movie(tmp_path / "Scene.mp4", 40, keyframes={0, 12, 31})
+    entries = index_chapters(movie, [("Introduction", 0), ("Proof", 12), ("Conclusion", 31)])
+    assert [(e["name"], e["frame"], e["start"]) for e in entries] == [
+        ("Introduction", 0, 0.0), ("Proof", 12, 0.4), ("Conclusion", 31, pytest.approx(31 / 30, abs=1e-3)),
+    ]
+    offsets = [e["offset"] for e in entries]
+    assert offsets == sorted(offsets) and len(set(offsets)) == 3
+    saved = json.loads(chapters_path(movie).read_text(encoding="utf-8"))
+    assert saved["movie"] == "Scene.mp4" and saved["chapters"] == entries
+    assert reindex_chapters(movie) == entries
+
+
+def test_chapter_off_a_keyframe_is_an_error(tmp_path):
+    movie = write_movie(tmp_path / "Scene.mp4", 20, keyframes={0, 10})
+    with pytest.raises(ValueError, match="not on a keyframe"):
+        index_chapters(movie, [("Introduction", 0), ("Proof", 12)])
@@ -0,0 +1,87 @@
+import importlib
+import os
+import textwrap
+
+import pytest
+
+from render import daemon
+from render.daemon import Metrics, RenderDaemon
+
+JOB = """
+import os
+
+VERSION = {version}
+
+
+def job(script, scene_name, quality, **options):
+    return {{"scene": scene_name, "version": VERSION, "pid": os.getpid(), "started": 0.0, "finished": 1.0}}
+"""
+
+
+def crash(script, scene_name, quality, **options):
+    os._exit(1)
+
+
+def succeed(script, scene_name, quality, **options):
+    return {"scene": scene_name, "movies": [], "pid": os.getpid(), "started": 0.0, "finished": 1.0}
+
+
+def skip_warm_up():
+    pass
+
+
+class QuickDaemon(RenderDaemon):
+    warm_up = staticmethod(skip_warm_up)
+
+
+@pytest.fixture
+def server():
+    server = QuickDaemon(("127.0.0.1", 0), workers=1)
+    yield server
+    server.server_close()
+
+
+def test_a_dead_worker_fails_its_job_and_the_next_job_gets_a_new_pool(server):
+    server.run_job = crash
+    results = server.render({"script": "lesson.py", "scenes": ["A"]})
+    assert "BrokenProcessPool" in results[0]["error"]
+
+    server.run_job = succeed
+    results = server.render({"script": "lesson.py", "scenes": ["A", "B"]})
+    assert [result["scene"] for result in results] == ["A", "B"]
+    assert not any("error" in result for result in results)
+    assert server.metrics.snapshot()["failed"] == 1
+
+
+def write_job(path, version):
+    path.write_text(textwrap.dedent(JOB.format(version=version)))
+    # Past the second-resolution mtime check of cached bytecode.
+    mtime = path.stat().st_mtime + 10 * version
+    os.utime(path, (mtime, mtime))
+
+
+def test_new_workers_run_the_edited_code(server, tmp_path, monkeypatch):
+    module = tmp_path / "edited_job.py"
+    write_job(module, 1)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    server.run_job = importlib.import_module("edited_job").job
+    version = ["before"]
+    monkeypatch.setattr(daemon, "_code_version", lambda: tuple(version))
+    first = server.ensure_pool()
+    assert server.render({"script": "lesson.py", "scenes": ["A"]})[0]["version"] == 1
+
+    write_job(module, 2)
+    assert server.render({"script": "lesson.py", "scenes": ["A"]})[0]["version"] == 1
+    version[0] = "after"
+    assert server.render({"script": "lesson.py", "scenes": ["A"]})[0]["version"] == 2
+    assert server.ensure_pool() is not first
+
+
+def test_metrics_percentiles():
+    metrics = Metrics(workers=2)
+    for run in range(1, 11):
+        metrics.submitted()
+        metrics.finished(0.0, {"started": 0.5, "finished": 0.5 + run})
+    snapshot = metrics.snapshot()
+    assert snapshot["done"] == 10 and snapshot["pending"] == 0
+    assert snapshot["render_time"] == {"p50": 6.0, "p95": 10.0, "max": 10.0}
@@ -0,0 +1,74 @@
+import textwrap
+
+import numpy as np
+from manim import Camera, Square, tempconfig
+
+from render.goldens import (
+    TOLERANCE, check_scene, compare, distance, phash, snapshot_scene, thumbnail, update_golden,
+)
+
+SCRIPT = """
+from manim import *
+
+
+class StillLife(Scene):
+    def construct(self):
+        self.add(Square(fill_opacity=0.5))
+
+
+class HeldSquare(Scene):
+    def construct(self):
+        self.add(Square(fill_opacity=0.5))
+        self.wait()
+"""
+
+
+def frame(seed, shape=(90, 160, 4)):
+    rng = np.random.default_rng(seed)
+    pixels = np.zeros(shape, dtype=np.uint8)
+    x, y = rng.integers(10, 80, 2)
+    pixels[y:y + 40, x:x + 60] = 255
+    return pixels
+
+
+def snapshots(*seeds):
+    return [(float(i), phash(frame(seed)), thumbnail(frame(seed))) for i, seed in enumerate(seeds)]
+
+
+def test_phash_tolerates_small_changes_but_not_new_content():
+    base = frame(1)
+    brighter = np.clip(base.astype(int) + 3, 0, 255).astype(np.uint8)
+    assert distance(phash(base), phash(base)) == 0
+    assert distance(phash(base), phash(brighter)) <= TOLERANCE
+    assert distance(phash(base), phash(frame(2))) > TOLERANCE
+
+
+def test_compare_flags_changed_missing_and_extra_frames(tmp_path):
+    script = tmp_path / "lesson.py"
+    update_golden(script, "Scene", snapshots(1, 2))
+    statuses = [r["status"] for r in compare(script, "Scene", snapshots(1, 3, 4))]
+    assert statuses == ["ok", "changed", "extra"]
+    assert [r["status"] for r in compare(script, "Scene", snapshots(1))] == ["ok", "missing"]
+
+
+def test_scene_without_plays_gets_a_snapshot(tmp_path):
+    script = tmp_path / "lesson.py"
+    script.write_text(textwrap.dedent(SCRIPT))
+    assert len(snapshot_scene(script, "StillLife")) == 1
+    _, _, outcome, _ = check_scene(script, "StillLife")
+    assert outcome == "recorded"
+    _, _, outcome, results = check_scene(script, "StillLife")
+    assert outcome == "compared" and [r["status"] for r in results] == ["ok"]
+
+
+def test_snapshot_after_a_wait_draws_translucent_fills_once(tmp_path):
+    script = tmp_path / "lesson.py"
+    script.write_text(textwrap.dedent(SCRIPT))
+    (_, _, image), = snapshot_scene(script, "HeldSquare")
+    with tempconfig({"quality": "low_quality"}):
+        camera = Camera()
+        camera.capture_mobjects([Square(fill_opacity=0.5)])
+        expected = thumbnail(camera.pixel_array)
+    # A fill drawn twice comes out at 75% instead of 50% grey.
+    difference = np.abs(np.asarray(image, dtype=int) - np.asarray(expected, dtype=int))
+    assert difference.max() <= 2
@@ -0,0 +1,52 @@
+import json
+import textwrap
+
+from render.i18n import available_locales, extract, gettext, main, update_catalog, use_locale
+
+SCRIPT = """
+from render.i18n import gettext as _
+
+title = Text(_("Step 1"), font_size=28)
+note = Text(_('{n} squares').format(n=4))
+again = _("Step 1")
+plain = Text("not translated")
+"""
+
+
+def lesson(tmp_path):
+    script = tmp_path / "lesson.py"
+    script.write_text(textwrap.dedent(SCRIPT))
+    return script
+
+
+def test_extract_finds_each_string_once_in_source_order(tmp_path):
+    assert extract(lesson(tmp_path)) == ["Step 1", "{n} squares"]
+
+
+def test_update_adds_blanks_and_keeps_translations(tmp_path):
+    script = lesson(tmp_path)
+    catalog = tmp_path / "locales" / "es.json"
+    catalog.parent.mkdir()
+    catalog.write_text(json.dumps({"Step 1": "Paso 1"}))
+    assert update_catalog(script, "es") == ["{n} squares"]
+    assert json.loads(catalog.read_text()) == {"Step 1": "Paso 1", "{n} squares": ""}
+    assert available_locales(script) == ["es"]
+
+
+def test_gettext_falls_back_to_english(tmp_path):
+    script = lesson(tmp_path)
+    update_catalog(script, "es")
+    catalog = tmp_path / "locales" / "es.json"
+    catalog.write_text(json.dumps({"Step 1": "Paso 1", "{n} squares": ""}))
+    with use_locale(script, "es"):
+        assert gettext("Step 1") == "Paso 1"
+        assert gettext("{n} squares") == "{n} squares"
+    assert gettext("Step 1") == "Step 1"
+
+
+def test_command_line(tmp_path, capsys):
+    script = lesson(tmp_path)
+    assert main(["extract", str(script)]) == 0
+    assert capsys.readouterr().out.splitlines() == ['"Step 1"', '"{n} squares"']
+    assert main(["update", str(script), "fr"]) == 0
+    assert "2 new strings" in capsys.readouterr().out
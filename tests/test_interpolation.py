@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from manim import (
+    BLUE, DOWN, GREEN, LEFT, PI, RED, UP,
+    Animation, Circle, Dot, Scene, Square, Transform, Triangle, VGroup,
+)
+
+from render.interpolation import BatchedScene, TransformBatch
+
+
+def make_transforms():
+    return [
+        Transform(Square(color=BLUE).shift(2 * LEFT), Circle(color=RED, fill_opacity=0.5)),
+        Transform(Triangle(color=GREEN), Square(stroke_width=8).shift(UP), path_arc=PI / 2),
+        Transform(
+            VGroup(Square(), Circle()).shift(DOWN),
+            VGroup(Circle(fill_opacity=1), Triangle()),
+            path_arc=-PI / 3,
+        ),
+    ]
+
+
+def state(animations):
+    family = [sub for anim in animations for sub in anim.mobject.family_members_with_points()]
+    return [
+        (sub.points.copy(), sub.fill_rgbas.copy(), sub.stroke_rgbas.copy(), sub.stroke_width)
+        for sub in family
+    ]
+
+
+def assert_same(a, b):
+    assert len(a) == len(b)
+    for left, right in zip(a, b):
+        for x, y in zip(left, right):
+            np.testing.assert_allclose(x, y, atol=1e-9)
+
+
+@pytest.mark.parametrize("alpha", [0.0, 0.3, 0.5, 0.87, 1.0])
+def test_batch_matches_stock_interpolation(alpha):
+    stock, batched = make_transforms(), make_transforms()
+    for anim in stock + batched:
+        anim.begin()
+    batch = TransformBatch.collect(batched)
+    assert batch is not None and all(anim in batch for anim in batched)
+
+    for anim in stock:
+        anim.interpolate(alpha)
+    batch.interpolate([alpha] * len(batched))
+    assert_same(state(stock), state(batched))
+
+
+def test_transforms_with_updaters_are_left_to_manim():
+    transforms = make_transforms()
+    transforms[0].mobject.add_updater(lambda m, dt: m)
+    for anim in transforms:
+        anim.begin()
+    batch = TransformBatch.collect(transforms)
+    assert transforms[0] not in batch
+    assert transforms[1] in batch
+
+
+class Probe(Animation):
+    """Records what ``watched`` looks like when the play loop reaches it."""
+    def __init__(self, watched):
+        super().__init__(Dot())
+        self.watched = watched
+        self.seen = []
+
+    def interpolate(self, alpha):
+        self.seen.append(self.watched.points.copy())
+
+
+def run_play(update_to_time, batched):
+    transforms = make_transforms()
+    # The probe sits between two batched Transforms, so it must see the
+    # second one's mobject as the previous frame left it.
+    probe = Probe(transforms[2].mobject[0])
+    animations = [transforms[0], probe, transforms[1], transforms[2]]
+    for anim in animations:
+        anim.begin()
+    scene = SimpleNamespace(
+        animations=animations,
+        last_t=0.0,
+        transform_batch=TransformBatch.collect(animations) if batched else None,
+        update_mobjects=lambda dt: None,
+        update_meshes=lambda dt: None,
+        update_self=lambda dt: None,
+    )
+    for t in np.linspace(0, 1, 7)[1:]:
+        update_to_time(scene, t)
+    return probe.seen, state(transforms)
+
+
+def test_batched_play_keeps_the_stock_animation_order():
+    stock_seen, stock_state = run_play(Scene.update_to_time, batched=False)
+    seen, final = run_play(BatchedScene.update_to_time, batched=True)
+    assert_same([(s,) for s in stock_seen], [(s,) for s in seen])
+    assert_same(stock_state, final)
@@ -0,0 +1,53 @@
+import numpy as np
+
+from render.layout import GridIndex, _segments_hit_box
+
+
+def segments(*pairs):
+    starts, ends = zip(*pairs)
+    return np.array(starts, dtype=float), np.array(ends, dtype=float)
+
+
+def test_grid_finds_overlapping_boxes_only():
+    index = GridIndex()
+    a = index.insert([[0, 0], [1, 1]], "a")
+    b = index.insert([[0.5, 0.5], [2, 2]], "b")
+    index.insert([[3, 3], [4, 4]], "c")
+    assert index.query_box([[0.8, 0.8], [1.5, 1.5]]) == {a, b}
+    assert index.query_box([[-2, -2], [-1, -1]]) == set()
+
+
+def test_grid_ignores_boxes_that_only_touch():
+    index = GridIndex()
+    index.insert([[0, 0], [1, 1]], "a")
+    assert index.query_box([[1, 0], [2, 1]]) == set()
+
+
+def test_boxes_spanning_many_cells_are_found_from_any_of_them():
+    index = GridIndex(cell=0.5)
+    wide = index.insert([[-3, -0.1], [3, 0.1]], "caption")
+    assert index.query_box([[2.5, -0.5], [2.9, 0.5]]) == {wide}
+    assert index.query_box([[-2.9, -0.5], [-2.5, 0.5]]) == {wide}
+
+
+def test_segments_hit_box_cases():
+    low, high = np.array([0.0, 0.0]), np.array([1.0, 1.0])
+    starts, ends = segments(
+        ([-1, 0.5], [2, 0.5]),    # crosses straight through
+        ([0.2, 0.2], [0.4, 0.6]),  # entirely inside
+        ([-1, 2], [2, 2]),        # parallel, above the box
+        ([2, -1], [3, 2]),        # beside the box
+        ([-1, -0.5], [0.5, 1.5]),  # diagonal, clips a corner
+        ([-1, 1.5], [0.5, 3]),    # diagonal, misses the corner
+        ([0.5, 0.5], [0.5, 0.5]),  # a point inside
+    )
+    hits = _segments_hit_box(starts, ends, low, high)
+    assert hits.tolist() == [True, True, False, False, True, False, True]
+
+
+def test_query_segments_reports_boxes_an_outline_crosses():
+    index = GridIndex()
+    crossed = index.insert([[0, 0], [1, 1]], "crossed")
+    index.insert([[3, 0], [4, 1]], "clear")
+    starts, ends = segments(([-1, 0.5], [2, 0.5]), ([2, 0.5], [2, 3]))
+    assert index.query_segments(starts, ends) == {crossed}
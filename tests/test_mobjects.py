@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from manim import BLUE, Camera, Polygon
+
+from render.mobjects import PolygonBatch
+
+TRIANGLE = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=float)
+
+
+def rotation(angle):
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+def separate_shapes():
+    return np.array([TRIANGLE * 1.5 + offset for offset in ([-5, -1, 0], [-1, 0.5, 0], [3, -2, 0])])
+
+
+def test_shapes_round_trip_through_set_shapes():
+    rng = np.random.default_rng(0)
+    shapes = rng.uniform(-3, 3, (5, 4, 3))
+    batch = PolygonBatch(shapes)
+    assert np.allclose(batch.shapes, shapes)
+    other = rng.uniform(-3, 3, (5, 4, 3))
+    assert np.allclose(batch.set_shapes(other).shapes, other)
+    assert np.allclose(batch.get_shape(2), other[2])
+
+
+def test_shapes_follow_the_batch_when_it_moves():
+    batch = PolygonBatch(separate_shapes())
+    batch.shift([1, 2, 0])
+    assert np.allclose(batch.shapes, separate_shapes() + [1, 2, 0])
+
+
+def test_from_transforms_matches_per_shape_matrices():
+    angles = [0.0, 0.5, 2.0]
+    shifts = np.array([[1, 0, 0], [0, 2, 0], [-1, -1, 0]], dtype=float)
+    batch = PolygonBatch.from_transforms(TRIANGLE, [rotation(a) for a in angles], shifts)
+    expected = [TRIANGLE @ rotation(a).T + shift for a, shift in zip(angles, shifts)]
+    assert np.allclose(batch.shapes, expected)
+
+
+def test_apply_to_shapes_only_moves_the_selected_shapes():
+    shapes = separate_shapes()
+    batch = PolygonBatch(shapes)
+    matrices = [rotation(1.0), np.diag([2.0, 0.5, 1.0])]
+    shifts = np.array([[0, 1, 0], [2, 0, 0]], dtype=float)
+    batch.apply_to_shapes(matrices, shifts, indices=[0, 2])
+    expected = shapes.copy()
+    for index, matrix, shift in zip([0, 2], matrices, shifts):
+        expected[index] = shapes[index] @ matrix.T + shift
+    assert np.allclose(batch.shapes, expected)
+
+
+def test_batch_draws_the_same_pixels_as_separate_polygons():
+    style = {"color": BLUE, "fill_opacity": 0.6, "stroke_width": 4}
+    batched = Camera(pixel_width=320, pixel_height=180)
+    batched.capture_mobjects([PolygonBatch(separate_shapes(), **style)])
+    separate = Camera(pixel_width=320, pixel_height=180)
+    separate.capture_mobjects([Polygon(*shape, **style) for shape in separate_shapes()])
+    assert batched.pixel_array.any()
+    assert np.abs(batched.pixel_array.astype(int) - separate.pixel_array.astype(int)).max() <= 1
+
+
+def test_edited_points_no_longer_give_shapes():
+    batch = PolygonBatch(separate_shapes())
+    batch.points = batch.points[:-4]
+    with pytest.raises(ValueError, match="no longer describe the original shapes"):
+        batch.shapes
+    with pytest.raises(ValueError, match="no longer describe the original shapes"):
+        batch.apply_to_shapes(shifts=[[1, 0, 0]] * 3)
@@ -0,0 +1,38 @@
+import pytest
+from manim import Animation, Dot, Wait
+
+from render.pacing import PACINGS, PacedScene, Pacing
+
+
+def test_parse_presets_and_custom_scales():
+    assert Pacing.parse("slow") is PACINGS["slow"]
+    custom = Pacing.parse("wait=1.5,run_time=1.2")
+    assert custom == Pacing("run_time1.2_wait1.5", wait=1.5, run_time=1.2)
+    with pytest.raises(ValueError):
+        Pacing.parse("sideways")
+
+
+class Compiled:
+    def compile_animations(self, *args, **kwargs):
+        return self.animations
+
+
+def paced_play(pacing, animations):
+    scene = type("Scene", (PacedScene, Compiled), {"pacing": pacing})()
+    scene.animations = animations
+    return scene.compile_animations()
+
+
+def test_waits_and_animations_scale_separately():
+    wait, move = Wait(2), Animation(Dot(), run_time=1.5)
+    paced_play(Pacing("custom", wait=1.5, run_time=2), [wait, move])
+    assert wait.run_time == wait.duration == pytest.approx(3)
+    assert move.run_time == pytest.approx(3)
+
+
+def test_unscaled_run_times_are_left_alone():
+    wait, move = Wait(2), Animation(Dot(), run_time=1.5)
+    paced_play(PACINGS["slow"], [wait, move])
+    assert wait.duration == pytest.approx(3)
+    # Untouched, so the play hashes exactly as without pacing.
+    assert move.run_time == 1.5
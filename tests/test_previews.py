@@ -0,0 +1,52 @@
+import numpy as np
+from PIL import Image
+
+from render.previews import PREVIEW_WIDTH, THUMBNAIL_WIDTH, PreviewSampler, drawn_fraction, write_previews
+
+
+def frame(value=0, drawn=0.0, shape=(90, 160, 4)):
+    pixels = np.full(shape, value, dtype=np.uint8)
+    pixels[-max(1, int(shape[0] * drawn)):, :, :3] = 200 if drawn else value
+    return pixels
+
+
+def test_sampler_takes_one_frame_per_second_across_held_frames(tmp_path):
+    sampler = PreviewSampler(tmp_path, frame_rate=30)
+    sampler.add("play", frame(), num_frames=1)
+    sampler.add("play", frame(), num_frames=59)
+    sampler.add("play", frame(), num_frames=31)
+    # Frames 0, 30, 60 and 90 of the play are sampling points.
+    assert len(sampler.samples["play"]) == 4
+    assert sampler.samples["play"][0].shape[1] == PREVIEW_WIDTH
+
+
+def test_samples_survive_a_rebuild_and_are_pruned_with_their_play(tmp_path):
+    sampler = PreviewSampler(tmp_path, frame_rate=30)
+    sampler.add("a", frame(), 30)
+    sampler.add("b", frame(), 1)
+    sampler.save()
+    later = PreviewSampler(tmp_path, frame_rate=30)
+    assert len(later.load(["a", "b", "uncached"])) == 2
+    assert len(later.load_thumbnails(["a", "b", "uncached"])) == 2
+    later.prune({"a"})
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.npy", "a.thumbnail.npz"]
+
+
+def test_thumbnail_skips_the_faded_out_ending(tmp_path):
+    sampler = PreviewSampler(tmp_path, frame_rate=1)
+    for drawn in (0.1, 0.6, 0.3, 0.0):
+        sampler.add("play", frame(drawn=drawn))
+    write_previews(tmp_path / "out", "Scene", frame(), sampler.load(["play"]), sampler.load_thumbnails(["play"]))
+    thumbnail = Image.open(tmp_path / "out" / "Scene.webp")
+    assert thumbnail.width == THUMBNAIL_WIDTH
+    assert drawn_fraction(np.asarray(thumbnail.convert("RGB"))) > 0.5
+    assert (tmp_path / "out" / "Scene.preview.webp").exists()
+
+
+def test_final_frame_is_the_thumbnail_when_it_shows_the_most(tmp_path):
+    sampler = PreviewSampler(tmp_path, frame_rate=1)
+    sampler.add("play", frame(drawn=0.2))
+    write_previews(tmp_path, "Scene", frame(drawn=0.5), sampler.load(["play"]), sampler.load_thumbnails(["play"]))
+    thumbnail = Image.open(tmp_path / "Scene.webp")
+    assert thumbnail.width == THUMBNAIL_WIDTH
+    assert drawn_fraction(np.asarray(thumbnail.convert("RGB"))) > 0.4
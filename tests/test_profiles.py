@@ -0,0 +1,53 @@
+from fractions import Fraction
+
+import av
+import numpy as np
+import pytest
+
+from render.profiles import Profile, encode, probe_master, ssim
+
+
+def write_movie(path, frames, keyframes=()):
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=30, options={"forced-idr": "1", "g": "300"})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        container.start_encoding()
+        for index in range(frames):
+            pixels = np.full((48, 64, 3), (index * 7) % 256, dtype=np.uint8)
+            pixels[:, : index % 64] = 255
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+            frame.pts, frame.time_base = index, Fraction(1, 30)
+            frame.pict_type = (
+                av.video.frame.PictureType.I if index in keyframes else av.video.frame.PictureType.NONE
+            )
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+
+def test_ssim_is_one_for_identical_frames_and_drops_with_noise():
+    rng = np.random.default_rng(0)
+    frame = np.tile(np.linspace(0, 255, 64), (48, 1)).astype(np.uint8)
+    noisy = np.clip(frame + rng.normal(0, 20, frame.shape), 0, 255).astype(np.uint8)
+    assert ssim(frame, frame) == pytest.approx(1.0)
+    assert ssim(frame, noisy) < 0.9
+
+
+def test_encode_keeps_the_masters_keyframes_and_moves_the_index_up_front(tmp_path):
+    master, output = tmp_path / "master.mp4", tmp_path / "out.mp4"
+    write_movie(master, 40, keyframes={0, 12, 31})
+    count, keyframes, _, _ = probe_master(master, samples=4)
+    assert count == 40 and {0, 12, 31} <= set(keyframes)
+
+    encode(master, output, Profile(crf=30), keyframes)
+    assert probe_master(output, samples=4)[1] == keyframes
+    data = output.read_bytes()
+    assert data.index(b"moov") < data.index(b"mdat")
+
+
+def test_movie_without_frames_is_a_clear_error(tmp_path):
+    empty = tmp_path / "empty.mp4"
+    write_movie(empty, 0)
+    with pytest.raises(ValueError, match="no video"):
+        probe_master(empty)
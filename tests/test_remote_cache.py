@@ -0,0 +1,129 @@
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+from manim import Text, tempconfig
+
+from render.remote_cache import (
+    DIGEST_HEADER, CacheHandler, CacheServer, RemoteCache, digest_path, fetch_texts_on_miss, sha256, use_remote_cache,
+    valid_key,
+)
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = CacheServer(("127.0.0.1", 0), tmp_path / "cache")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def client(server):
+    host, port = server.server_address[:2]
+    return RemoteCache(f"http://{host}:{port}")
+
+
+def status(server, method, key, data=b"", headers=None):
+    host, port = server.server_address[:2]
+    req = urllib.request.Request(f"http://{host}:{port}/{key}", data=data, method=method, headers=headers or {})
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+@pytest.mark.parametrize("key", ["partial/123_456.json", "partial/segment-7.mp4", "texts/abc.svg"])
+def test_plain_keys_are_valid(key):
+    assert valid_key(key)
+
+
+@pytest.mark.parametrize("key", [
+    "partial/..", "partial/.x.json.sha256", "partial/a..b", "partial/a/b", "other/x.mp4", "partial/", "partial/.",
+])
+def test_keys_outside_an_entry_name_are_rejected(key):
+    assert not valid_key(key)
+
+
+def test_round_trip_and_listing(server):
+    cache = client(server)
+    assert cache.put("partial/1_2_3.json", b"{}")
+    assert cache.get("partial/1_2_3.json") == b"{}"
+    assert cache.keys("partial") == {"1_2_3.json"}
+    assert cache.get("partial/4_5_6.json") is None
+    assert not cache.offline
+
+
+def test_bad_keys_cannot_reach_digests_or_directories(server):
+    cache = client(server)
+    cache.put("partial/x.json", b"{}")
+    digest = digest_path(server.root / "partial" / "x.json")
+    body = b"forged"
+    headers = {DIGEST_HEADER: sha256(body)}
+    assert status(server, "PUT", "partial/.x.json.sha256", body, headers) == 400
+    assert status(server, "PUT", "partial/..", body, headers) == 400
+    assert status(server, "PUT", "partial/", body, headers) == 400
+    assert status(server, "GET", "partial/..") == 400
+    assert digest.read_text() == sha256(b"{}")
+    assert cache.get("partial/x.json") == b"{}"
+
+
+def test_corrupted_entry_is_a_miss(server):
+    cache = client(server)
+    cache.put("partial/x.mp4", b"movie")
+    (server.root / "partial" / "x.mp4").write_bytes(b"movi")
+    assert cache.get("partial/x.mp4") is None
+
+
+def test_missing_digest_is_a_miss(tmp_path):
+    class NoDigestHandler(CacheHandler):
+        def send_header(self, keyword, value):
+            if keyword != DIGEST_HEADER:
+                super().send_header(keyword, value)
+
+    server = CacheServer(("127.0.0.1", 0), tmp_path)
+    server.RequestHandlerClass = NoDigestHandler
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        cache = client(server)
+        (tmp_path / "partial").mkdir()
+        (tmp_path / "partial" / "x.json").write_bytes(b"{}")
+        digest_path(tmp_path / "partial" / "x.json").write_text("ignored")
+        assert cache.get("partial/x.json") is None
+        assert not cache.offline
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_texts_are_fetched_one_at_a_time_when_missing(server, tmp_path):
+    fetch_texts_on_miss()
+    host, port = server.server_address[:2]
+    first, second = tmp_path / "first", tmp_path / "second"
+    with use_remote_cache(f"http://{host}:{port}") as cache:
+        with tempconfig({"text_dir": str(first)}):
+            Text("Caption")
+            Text("Only on the first machine")
+        assert len(cache.laid_out) == 2
+        cache.push_texts()
+        assert len(cache.keys("texts")) == 2
+
+        with tempconfig({"text_dir": str(second)}):
+            Text("Caption")
+        # Fetched rather than laid out, and nothing else came with it.
+        assert not cache.laid_out
+        fetched, = second.glob("*.svg")
+        assert fetched.read_bytes() == (first / fetched.name).read_bytes()
+
+
+def test_unreachable_server_goes_offline(server):
+    cache = client(server)
+    server.shutdown()
+    server.server_close()
+    assert cache.get("partial/x.json") is None
+    assert cache.offline
+    assert not cache.put("partial/x.json", b"{}")
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from render.ring import FrameRing
+
+
+def frame(value, shape=(4, 6, 4)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_frames_come_out_in_order_with_counts_and_keyframes():
+    ring = FrameRing((4, 6, 4), slots=4)
+    ring.push(frame(1), num_frames=1, keyframe=True)
+    ring.push(frame(2), num_frames=3)
+    ring.close()
+    out = [(int(f[0, 0, 0]), n, key) for f, n, key in ring.drain()]
+    assert out == [(1, 1, True), (2, 3, False)]
+    assert ring.metrics.frames == 4
+
+
+def test_push_copies_the_frame():
+    ring = FrameRing((4, 6, 4), slots=2)
+    source = frame(7)
+    ring.push(source)
+    source[:] = 0  # the camera draws the next frame into the same array
+    ring.close()
+    (out, _, _), = [(f.copy(), n, key) for f, n, key in ring.drain()]
+    assert np.all(out == 7)
+
+
+def test_producer_blocks_when_every_slot_is_in_flight():
+    ring = FrameRing((4, 6, 4), slots=2)
+    seen = []
+
+    def consume():
+        for f, _, _ in ring.drain():
+            time.sleep(0.02)
+            seen.append(int(f[0, 0, 0]))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for value in range(8):
+        ring.push(frame(value))
+    ring.close()
+    consumer.join()
+    assert seen == list(range(8))
+    assert ring.metrics.max_depth <= 2
+    assert ring.metrics.producer_stalls > 0
+
+
+def test_producer_gets_the_consumers_error_instead_of_hanging():
+    ring = FrameRing((4, 6, 4), slots=2)
+
+    def consume():
+        try:
+            for _ in ring.drain():
+                raise OSError("No space left on device")
+        except OSError as error:
+            ring.fail(error)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    with pytest.raises(OSError, match="No space"):
+        for value in range(8):
+            ring.push(frame(value))
+        ring.close()
+    consumer.join(timeout=1)
+    assert not consumer.is_alive()
@@ -0,0 +1,82 @@
+import numpy as np
+from manim import (
+    DOWN, LEFT, RIGHT, UP, Camera, Circle, FadeIn, MovingCamera, MovingCameraScene, MultiCamera, Square,
+    ThreeDCamera, Triangle, tempconfig,
+)
+from manim.utils.hashing import get_hash_from_play_call
+
+from render.renderer import LessonRenderer
+from render.tiles import TiledCamera, tiled
+
+
+class BandedCamera(TiledCamera):
+    bands = 4
+    min_pixels = 0
+
+
+def mobjects():
+    return [
+        Square(side_length=3, fill_opacity=0.6, stroke_width=8).shift(LEFT * 3 + UP),
+        Circle(radius=2, fill_opacity=0.4, stroke_width=12).shift(DOWN),
+        Triangle(fill_opacity=0.8).scale(2).shift(RIGHT * 3),
+        Square(side_length=0.5, fill_opacity=1).shift(UP * 3.5),
+    ]
+
+
+def draw(camera_class):
+    camera = camera_class(pixel_width=320, pixel_height=180)
+    camera.capture_mobjects(mobjects())
+    return camera.pixel_array
+
+
+def test_bands_draw_the_same_pixels_as_one_surface():
+    tiled, single = draw(BandedCamera), draw(Camera)
+    assert tiled.any()
+    # Band edges may round a stroke's antialiasing differently by a level.
+    assert np.abs(tiled.astype(int) - single.astype(int)).max() <= 1
+
+
+def test_play_hash_ignores_band_state():
+    scene = object()
+
+    def play_hash(camera):
+        shapes = mobjects()
+        return get_hash_from_play_call(scene, camera, [FadeIn(shapes[0])], shapes)
+
+    camera = BandedCamera(pixel_width=320, pixel_height=180)
+    before = play_hash(camera)
+    camera.capture_mobjects(mobjects())
+    assert play_hash(camera) == before
+    assert play_hash(BandedCamera(pixel_width=320, pixel_height=180)) == before
+
+
+def test_scene_cameras_keep_their_class_and_tile_when_they_can():
+    assert tiled(Camera) is TiledCamera
+    for camera_class in (MovingCamera, MultiCamera):
+        assert issubclass(tiled(camera_class), TiledCamera)
+        assert issubclass(tiled(camera_class), camera_class)
+    # Projects points before drawing, which the bands can't see.
+    assert tiled(ThreeDCamera) is ThreeDCamera
+
+
+def test_lesson_renderer_uses_the_scenes_camera(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path), "write_to_movie": False}):
+        scene = MovingCameraScene(renderer=LessonRenderer())
+    assert isinstance(scene.renderer.camera, MovingCamera)
+    assert isinstance(scene.renderer.camera, TiledCamera)
+    assert scene.camera.frame is scene.renderer.camera.frame
+
+
+def test_bands_follow_a_moving_frame(monkeypatch):
+    monkeypatch.setattr(TiledCamera, "bands", 4)
+    monkeypatch.setattr(TiledCamera, "min_pixels", 0)
+    frames = []
+    for camera_class in (tiled(MovingCamera), MovingCamera):
+        camera = camera_class(pixel_width=320, pixel_height=180)
+        camera.capture_mobjects(mobjects())
+        # Same pixel array, new view: the bands must not keep the old one.
+        camera.reset()
+        camera.frame.scale(0.5).shift(LEFT * 2 + UP)
+        camera.capture_mobjects(mobjects())
+        frames.append(camera.pixel_array.astype(int))
+    assert np.abs(frames[0] - frames[1]).max() <= 1
@@ -0,0 +1,168 @@
+import os
+from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
+
+import av
+import numpy as np
+import pytest
+from manim import tempconfig
+
+from render.ring import FrameRing
+from render.writer import LessonFileWriter, SegmentIndex
+
+
+def test_segment_index_keeps_entries_from_concurrent_writers(tmp_path):
+    first = SegmentIndex(tmp_path / "Scene.segments")
+    second = SegmentIndex(tmp_path / "Scene.segments")
+    first["a"] = {"segment": "s1", "start": 0, "frames": 10}
+    second["b"] = {"segment": "s2", "start": 0, "frames": 5}
+    first["c"] = {"segment": "s1", "start": 10, "frames": 4}
+    for index in (first, second):
+        assert index.get("a")["frames"] == 10
+        assert index.get("b")["segment"] == "s2"
+        assert "c" in index
+    assert second.pop("a")["segment"] == "s1"
+    assert first.get("a") is None
+
+
+def test_segment_index_prunes_only_plays_without_files(tmp_path):
+    partial = tmp_path / "Scene"
+    partial.mkdir()
+    (partial / "kept.mp4").touch()
+    index = SegmentIndex(tmp_path / "Scene.segments")
+    index["kept"] = {"segment": "s", "start": 0, "frames": 1}
+    index["gone"] = {"segment": "s", "start": 1, "frames": 1}
+    index.prune(partial, ".mp4")
+    assert "kept" in index
+    assert "gone" not in index
+
+
+def test_segment_index_imports_the_old_shared_file(tmp_path):
+    legacy = tmp_path / "Scene.segments.json"
+    legacy.write_text('{"a": {"segment": "s", "start": 3, "frames": 2}}')
+    index = SegmentIndex(tmp_path / "Scene.segments")
+    index.import_legacy(legacy)
+    assert index.get("a") == {"segment": "s", "start": 3, "frames": 2}
+    assert not legacy.exists()
+
+
+def test_concat_entries_cut_coalesced_plays_out_of_their_segments(tmp_path):
+    index = SegmentIndex(tmp_path / "Scene.segments")
+    index["p1"] = {"segment": "s1", "start": 0, "frames": 15}
+    index["p2"] = {"segment": "s1", "start": 15, "frames": 30}
+    index["p4"] = {"segment": "s1", "start": 60, "frames": 15}
+    writer = SimpleNamespace(segment_index=index)
+    files = [tmp_path / f"{stem}.mp4" for stem in ("p1", "p2", "p3", "p4")]
+    with tempconfig({"frame_rate": 30}):
+        lines = LessonFileWriter.concat_entries(writer, files)
+    assert lines == [
+        # p1 and p2 sit back to back in s1, so they share one cut.
+        f"file 'file:{files[0].as_posix()}'",
+        "inpoint 0.000000",
+        "outpoint 1.500000",
+        f"file 'file:{files[2].as_posix()}'",
+        f"file 'file:{files[3].as_posix()}'",
+        "inpoint 2.000000",
+        "outpoint 2.500000",
+    ]
+
+
+def test_held_frames_encode_identically(tmp_path):
+    path = tmp_path / "held.mp4"
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (48, 64, 4), dtype=np.uint8)
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream("libx264", rate=30, options={"crf": "0"})
+        stream.width, stream.height, stream.pix_fmt = 64, 48, "yuv420p"
+        writer = SimpleNamespace(video_stream=stream, video_container=container)
+        LessonFileWriter.encode_and_write_frame(writer, frame, 6, keyframe=True)
+        for packet in stream.encode():
+            container.mux(packet)
+
+    with av.open(str(path)) as container:
+        decoded = [f.to_ndarray(format="rgb24") for f in container.decode(video=0)]
+    assert len(decoded) == 6
+    for held in decoded[1:]:
+        assert np.array_equal(held, decoded[0])
+
+
+def test_a_failed_encode_fails_the_partial_movie_instead_of_hanging():
+    def encode_and_write_frame(frame, num_frames, keyframe=False):
+        raise av.error.InvalidDataError(22, "bad frame")
+
+    writer = SimpleNamespace(ring=FrameRing((4, 6, 4), slots=2), encode_and_write_frame=encode_and_write_frame)
+    writer.writer_thread = Thread(target=LessonFileWriter.listen_and_write, args=(writer,))
+    writer.writer_thread.start()
+    with pytest.raises(av.error.InvalidDataError):
+        for _ in range(8):
+            writer.ring.push(np.zeros((4, 6, 4), dtype=np.uint8))
+        LessonFileWriter.close_partial_movie_stream(writer)
+    with pytest.raises(av.error.InvalidDataError):
+        LessonFileWriter.close_partial_movie_stream(writer)
+
+
+def write_partial(path, values, keyframes=(0,)):
+    """A partial movie encoded the way the writer encodes them, one flat frame per value."""
+    codec, pix_fmt, options = LessonFileWriter.partial_movie_options(None)
+    with av.open(str(path), mode="w") as container:
+        stream = container.add_stream(codec, rate=30, options=options)
+        stream.width, stream.height, stream.pix_fmt = 64, 48, pix_fmt
+        writer = SimpleNamespace(video_stream=stream, video_container=container)
+        for index, value in enumerate(values):
+            frame = np.full((48, 64, 4), value, dtype=np.uint8)
+            LessonFileWriter.encode_and_write_frame(writer, frame, 1, keyframe=index in keyframes)
+        for packet in stream.encode():
+            container.mux(packet)
+    return path
+
+
+def combining_writer(tmp_path):
+    writer = LessonFileWriter.__new__(LessonFileWriter)
+    writer.partial_movie_directory = tmp_path / "Scene"
+    writer.partial_movie_directory.mkdir()
+    writer.segment_index = SegmentIndex(tmp_path / "Scene.segments")
+    writer.scene_name = "Scene"
+    return writer
+
+
+def coalesced_plays(writer, values, starts):
+    """Hard links to one shared segment for plays starting at ``starts``."""
+    segment = write_partial(writer.partial_movie_directory / "segment.mp4", values, keyframes=starts)
+    plays = []
+    for number, (start, end) in enumerate(zip(starts, [*starts[1:], len(values)])):
+        play = writer.partial_movie_directory / f"play{number}.mp4"
+        os.link(segment, play)
+        writer.segment_index[play.stem] = {"segment": "s", "start": start, "frames": end - start}
+        plays.append(play)
+    return plays
+
+
+def decoded_levels(path):
+    with av.open(str(path)) as container:
+        return [int(round(f.to_ndarray(format="gray").mean())) for f in container.decode(video=0)]
+
+
+def test_standalone_partials_and_segments_concatenate_into_one_stream(tmp_path):
+    writer = combining_writer(tmp_path)
+    standalone = write_partial(writer.partial_movie_directory / "standalone.mp4", range(20, 120, 10))
+    plays = coalesced_plays(writer, range(130, 250, 10), [0, 6])
+    output = tmp_path / "Scene.mp4"
+    with tempconfig({"frame_rate": 30}):
+        LessonFileWriter.combine_files(writer, [standalone, *plays], output)
+
+    expected = [*range(20, 120, 10), *range(130, 250, 10)]
+    levels = decoded_levels(output)
+    assert len(levels) == len(expected)
+    assert all(abs(level - value) <= 4 for level, value in zip(levels, expected))
+
+
+def test_gif_cuts_coalesced_plays_out_of_their_segment(tmp_path):
+    writer = combining_writer(tmp_path)
+    plays = coalesced_plays(writer, range(20, 140, 10), [0, 6])
+    output = tmp_path / "Scene.gif"
+    with tempconfig({"frame_rate": 30, "pixel_width": 64, "pixel_height": 48}):
+        LessonFileWriter.combine_files(writer, plays[1:], output, create_gif=True)
+    # Only the second play's six frames, not the whole segment.
+    assert len(decoded_levels(output)) == 6
+    assert not (writer.partial_movie_directory / "Scene_cut.mp4").exists()